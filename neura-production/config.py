@@ -2,17 +2,41 @@ LICENSE_KEY = ''  # Брать ключ в боте, по кнопке "Софт
 
 TG_BOT_TOKEN = ''  # str ('2282282282:NzA4NTM1MDUxN8GGCiGs6T0Ik-kD2q7GmisthH_yyZvI8If84kN5VDkK')
 TG_USER_ID = None  # int (22822822) or None
+TG_DIGEST_WALLETS = 10  # Отправлять в Telegram одну сводку на каждые N отработавших кошельков
+TG_DIGEST_INTERVAL = 300  # ...или раз в N секунд, если кошельки заканчивают работу медленно
 CHERRY_SOLVER_API_KEY = ''  # @CherryCaptcha_bot
 CAPMONSTER_API_KEY = ''  # https://dash.capmonster.cloud/
 
 SHUFFLE_WALLETS = False
-PAUSE_BETWEEN_WALLETS = [10, 20]
+PAUSE_BETWEEN_WALLETS = [10, 20]  # Средний темп запуска кошельков: один новый кошелёк раз в столько секунд
+WALLET_STARTS_BURST = 1  # Сколько запусков может накопиться, пока все потоки заняты (1 - строго по одному)
 PAUSE_BETWEEN_MODULES = [20, 40]
 MAX_PARALLEL_ACCOUNTS = 50
+SCHEDULER_STATS_INTERVAL = 60  # Как часто (в секундах) выводить статистику очереди кошельков
+INTERLEAVE_ROUTES = False  # Освобождать поток на время паузы между модулями и брать в работу другой кошелек
+MAX_ACTIVE_ROUTES = 200  # Сколько кошельков может быть в работе одновременно при INTERLEAVE_ROUTES (не более MAX_PARALLEL_ACCOUNTS выполняют модуль)
+SHUTDOWN_TIMEOUT = 120  # Сколько секунд после Ctrl+C/SIGTERM ждать завершения уже начатых модулей (повторный Ctrl+C - сразу)
+RPC_CONNECTIONS_LIMIT = 200  # Максимум одновременных соединений ко всем RPC (соединения переиспользуются между кошельками)
+RPC_CONNECTIONS_PER_HOST = 20  # Максимум соединений к одному RPC через один прокси
+RPC_CLIENTS_CACHE_SIZE = 500  # Сколько RPC клиентов (сеть + прокси) держать в памяти для переиспользования
+BATCH_RPC_READS = True  # Отправлять независимые чтения из RPC одним JSON-RPC batch запросом (False - параллельными запросами)
+GAS_PRICE_TTL = 5  # Сколько секунд переиспользовать цену газа для всех кошельков одной сети
+USE_EIP1559 = True  # Отправлять транзакции с maxFeePerGas/maxPriorityFeePerGas, если сеть поддерживает EIP-1559
+BLOCK_POLL_INTERVAL = 1  # Как часто (в секундах) проверять новые блоки при ожидании подтверждения транзакций
 
 RETRIES = 10  # Сколько раз повторять 'зафейленное' действие
 PAUSE_BETWEEN_RETRIES = 5  # Пауза между повторами
 
+# 'batched' - выполненные задачи копятся в памяти и пишутся в БД пачками (при падении процесса теряется
+# не больше DB_FLUSH_INTERVAL секунд прогресса, эти задачи просто выполнятся заново при следующем запуске)
+# 'immediate' - каждая выполненная задача сразу пишется в БД
+DB_WRITE_MODE = 'batched'
+DB_WRITE_BATCH_SIZE = 100  # Максимум задач в одной транзакции
+DB_FLUSH_INTERVAL = 5  # Как часто (в секундах) сбрасывать накопленные задачи в БД
+BULK_DB_GENERATION = True  # Генерировать БД пачками: шифрование ключей на всех ядрах и вставка одной транзакцией на пачку
+DB_GENERATION_BATCH_SIZE = 1000  # Кошельков в одной пачке при генерации БД
+DB_SYNCHRONOUS = 'NORMAL'  # 'NORMAL' - быстрее, 'FULL' - fsync на каждый коммит (переживает и отключение питания)
+
 FAUCET = False # Краник, для использования крана нужно минимум 50 поинтов 
 BRIDGE = False # Бриджит ANKR из Sepolia в Neura
 CYCLE_SWAPS = False  # ANRK -> ETH -> ANRK -> BTC -> ANKR  -> ... -> ....
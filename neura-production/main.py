@@ -1,10 +1,13 @@
-from asyncio import run, set_event_loop_policy, gather, create_task, sleep, Lock
-from typing import Awaitable, Callable
+from asyncio import run, set_event_loop_policy
+from functools import partial
+from typing import Awaitable, Callable, Optional
 import os, platform
 
 import random
+import argparse
 import asyncio
 import logging
+import multiprocessing
 import sys
 
 from rich.console import Console
@@ -21,14 +24,25 @@ from questionary import select, Choice
 from loguru import logger
 
 from config import *
-from src.utils.data.helper import private_keys, proxies
+from src.utils.data.helper import get_private_keys, get_proxies
 from src.database.generate_database import generate_database
+from src.database.bulk_generate_database import bulk_generate_database
+from src.database.sync_database import sync_database
 from src.database.models import init_models, engine
+from src.database.migrations import apply_migrations
 from src.utils.data.mappings import module_handlers
 from src.utils.manage_tasks import manage_tasks
-from src.utils.retrieve_route import get_routes
+from src.database.utils.write_queue import task_write_queue
+from src.utils.retrieve_route import get_routes, ask_decryption_password
+from src.utils.request_client.web3_pool import web3_pool
+from src.utils.encryption import shutdown_crypto_executor, limit_crypto_workers
 from src.models.route import Route
-from src.utils.tg_app.telegram_notifications import TGApp
+from src.utils.tg_app.telegram_notifications import tg_notifier, WalletReport
+from src.utils.progress import progress_tracker
+from src.utils.scheduler import RouteScheduler
+from src.utils.sharding import ShardRunner, get_shard
+from src.utils.signals import install_signal_handlers
+from src.utils.password import password_source, PASSWORD_ENV, KEYRING_USER
 
 logging.getLogger("asyncio").setLevel(logging.CRITICAL)
 logging.basicConfig(level=logging.CRITICAL)
@@ -36,16 +50,13 @@ logging.basicConfig(level=logging.CRITICAL)
 if sys.platform == 'win32':
     set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
 
-processed_wallets_counter = 0
-processed_wallets_lock = Lock()
-
-
 def get_module():
     result = select(
         message="Choose module",
         choices=[
             Choice(title="1) Generate new database", value=1),
-            Choice(title="2) Work with existing database", value=2)
+            Choice(title="2) Work with existing database", value=2),
+            Choice(title="3) Sync existing database with wallets.txt and config", value=3)
         ],
         qmark="⚙️ ",
         pointer="🍒 "
@@ -53,74 +64,158 @@ def get_module():
     return result
 
 
-async def process_task(routes: list[Route]) -> None:
+async def process_task(
+        routes: list[Route],
+        decryption_password: str,
+        finish: Optional[Callable[[Route, list[str]], None]] = None
+) -> None:
     if not routes:
         logger.success(f'All tasks are completed')
         return
 
-    semaphore = asyncio.Semaphore(MAX_PARALLEL_ACCOUNTS)
+    scheduler = RouteScheduler(
+        run_module=partial(process_module, decryption_password=decryption_password),
+        finish_route=finish or finish_route,
+        slots=MAX_PARALLEL_ACCOUNTS,
+        interleave=INTERLEAVE_ROUTES,
+        workers=MAX_ACTIVE_ROUTES
+    )
+    scheduler_task = asyncio.create_task(scheduler.run(routes))
+
+    remove_handlers = install_shutdown_handlers(scheduler, scheduler_task)
+    try:
+        await scheduler_task
+    except asyncio.CancelledError:
+        if not scheduler.stopping:
+            raise
+        logger.warning('Active modules were interrupted, they will be retried on next start')
+    finally:
+        remove_handlers()
+
+
+def install_shutdown_handlers(scheduler: RouteScheduler, scheduler_task: asyncio.Task) -> Callable[[], None]:
+    loop = asyncio.get_running_loop()
+
+    def on_signal(_) -> None:
+        if scheduler.stopping:
+            logger.warning('Forced shutdown, interrupting active modules...')
+            scheduler_task.cancel()
+            return
+
+        logger.warning(
+            f'Shutdown requested, waiting up to {SHUTDOWN_TIMEOUT} seconds for active modules to finish '
+            f'(press Ctrl+C again to stop immediately)...'
+        )
+        scheduler.stop()
+        loop.call_later(SHUTDOWN_TIMEOUT, scheduler_task.cancel)
 
-    async def process_route_with_semaphore(route: Route) -> None:
-        async with semaphore:
-            await process_route(route)
+    return install_signal_handlers(on_signal)
 
-    wallet_tasks = []
-    for i, route in enumerate(routes):
-        wallet_tasks.append(create_task(process_route_with_semaphore(route)))
 
-        if i < len(routes) - 1:
-            time_to_pause = random.randint(PAUSE_BETWEEN_WALLETS[0], PAUSE_BETWEEN_WALLETS[1]) \
-                if isinstance(PAUSE_BETWEEN_WALLETS, list) else PAUSE_BETWEEN_WALLETS
-            logger.info(f'Сплю {time_to_pause} секунд перед следующим кошельком...')
-            await sleep(time_to_pause)
+async def process_module(route: Route, task: str, decryption_password: str) -> bool:
+    await route.wallet.unlock(decryption_password)
 
-    await gather(*wallet_tasks)
+    completed = await module_handlers[task](route)
+    if completed:
+        await manage_tasks(route.wallet.encrypted_key, route.wallet.address, task)
 
+    return bool(completed)
 
-async def process_route(route: Route) -> None:
-    private_key = route.wallet.private_key
 
-    for task in route.tasks:
-        completed = await module_handlers[task](route)
+def get_wallet_report(route: Route, completed_tasks: list[str]) -> WalletReport:
+    return WalletReport(
+        address=route.wallet.address,
+        completed_tasks=completed_tasks,
+        uncompleted_tasks=[task for task in route.tasks if task not in completed_tasks],
+    )
 
-        if completed:
-            await manage_tasks(route.wallet.encrypted_key, route.wallet.address, task)
 
-        time_to_pause = random.randint(PAUSE_BETWEEN_MODULES[0], PAUSE_BETWEEN_MODULES[1]) \
-            if isinstance(PAUSE_BETWEEN_MODULES, list) else PAUSE_BETWEEN_MODULES
+def report_wallet(report: WalletReport) -> None:
+    progress_tracker.wallet_processed(completed=not report.uncompleted_tasks)
+    tg_notifier.wallet_finished(report)
 
-        logger.info(f'Sleeping {time_to_pause} seconds before next module...')
-        await sleep(time_to_pause)
 
-    if TG_BOT_TOKEN and TG_USER_ID:
-        global processed_wallets_counter
-        global processed_wallets_lock
+def finish_route(route: Route, completed_tasks: list[str]) -> None:
+    report_wallet(get_wallet_report(route, completed_tasks))
 
-        async with processed_wallets_lock:
-            processed_wallets_counter += 1
-            current_index = processed_wallets_counter
 
-        tg_app = TGApp(
-            token=TG_BOT_TOKEN,
-            tg_id=TG_USER_ID,
-            private_key=private_key,
-            encrypted_key=route.wallet.encrypted_key,
-            processed_index=current_index,
-        )
-        await tg_app.send_message()
+def send_report_to_parent(route: Route, completed_tasks: list[str], events: multiprocessing.Queue) -> None:
+    report = get_wallet_report(route, completed_tasks)
+    progress_tracker.wallet_processed(completed=not report.uncompleted_tasks)
+    events.put(report)
+
+
+def run_shard(shard: int, shards: int, decryption_password: str, events: multiprocessing.Queue) -> None:
+    start_event_loop(process_shard(shard, shards, decryption_password, events))
+
+
+async def process_shard(shard: int, shards: int, decryption_password: str, events: multiprocessing.Queue) -> None:
+    routes = [
+        route for route in await get_routes() or []
+        if get_shard(route.wallet.address, shards) == shard
+    ]
+    logger.info(f'Shard {shard + 1}/{shards} | {len(routes)} wallets')
+    if not routes:
+        return
+
+    progress_tracker.total_wallets = len(routes)
+    limit_crypto_workers((os.cpu_count() or 1) // shards)
+    try:
+        await process_task(routes, decryption_password, finish=partial(send_report_to_parent, events=events))
+    finally:
+        await task_write_queue.close()
+        await web3_pool.close()
+        shutdown_crypto_executor()
 
 
-async def main(module: Callable) -> None:
+async def main(module: Callable, shards: int = 1) -> None:
     await init_models(engine)
+    await apply_migrations(engine)
     if module == 1:
+        private_keys, proxies = get_private_keys(), get_proxies()
         if SHUFFLE_WALLETS:
             random.shuffle(private_keys)
         logger.debug("Generating new database")
-        await generate_database(engine, private_keys, proxies)
+        if BULK_DB_GENERATION:
+            try:
+                await bulk_generate_database(engine, private_keys, proxies)
+            finally:
+                shutdown_crypto_executor()
+        else:
+            if not password_source.interactive:
+                logger.warning('BULK_DB_GENERATION = False: the legacy generator always asks for the password interactively')
+            await generate_database(engine, private_keys, proxies)
     elif module == 2:
         logger.debug("Working with the database")
         routes = await get_routes()
-        await process_task(routes)
+        if not routes:
+            logger.success(f'All tasks are completed')
+            return
+
+        await progress_tracker.seed()
+        decryption_password = await ask_decryption_password(routes[0].wallet.encrypted_key, routes[0].wallet.salt)
+        try:
+            if shards > 1:
+                shutdown_crypto_executor()
+                await ShardRunner(
+                    target=run_shard,
+                    shards=shards,
+                    decryption_password=decryption_password,
+                    on_report=report_wallet
+                ).run()
+            else:
+                await process_task(routes, decryption_password)
+        finally:
+            await task_write_queue.close()
+            await tg_notifier.close()
+            await web3_pool.close()
+            shutdown_crypto_executor()
+    elif module == 3:
+        logger.debug("Syncing the database")
+        try:
+            await sync_database(engine, get_private_keys(), get_proxies())
+        finally:
+            shutdown_crypto_executor()
     else:
         print("Wrong choice")
         return
@@ -130,8 +225,55 @@ def start_event_loop(awaitable: Awaitable[None]) -> None:
     run(awaitable)
 
 
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Run without arguments to choose the module interactively')
+    parser.add_argument(
+        '--password-env', default=PASSWORD_ENV, metavar='NAME',
+        help=f'Environment variable with the database password (default: {PASSWORD_ENV})'
+    )
+    parser.add_argument(
+        '--password-fd', type=int, metavar='FD',
+        help='Read the database password from the first line of this file descriptor'
+    )
+    parser.add_argument(
+        '--password-keyring', metavar='SERVICE',
+        help='Take the database password from the system keyring (requires "pip install keyring")'
+    )
+    parser.add_argument('--keyring-user', default=KEYRING_USER, help=f'Keyring user name (default: {KEYRING_USER})')
+    parser.add_argument(
+        '--shards', type=int, default=1,
+        help='Split wallets between N worker processes (only for "Work with existing database")'
+    )
+
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.add_parser('generate', help='Generate new database')
+    run_parser = subparsers.add_parser('run', help='Work with existing database')
+    run_parser.add_argument(
+        '--shards', type=int, default=argparse.SUPPRESS,
+        help='Split wallets between N worker processes'
+    )
+    subparsers.add_parser('sync', help='Sync existing database with wallets.txt and config')
+
+    return parser.parse_args()
+
+
+COMMANDS = {
+    'generate': 1,
+    'run': 2,
+    'sync': 3,
+}
+
+
 if __name__ == '__main__':
+    args = parse_args()
+    password_source.configure(
+        env=args.password_env,
+        fd=args.password_fd,
+        keyring_service=args.password_keyring,
+        keyring_user=args.keyring_user
+    )
+
     console = Console()
     print_logo(console)
-    module = get_module()
-    start_event_loop(main(module))
+    module = COMMANDS[args.command] if args.command else get_module()
+    start_event_loop(main(module, shards=max(1, args.shards)))
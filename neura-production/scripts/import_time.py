@@ -0,0 +1,66 @@
+import argparse
+import os
+import platform
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# same runtime main.py puts on sys.path, obfuscated modules can not be imported without it
+RUNTIME = os.path.join(ROOT, 'runtimes', f'{platform.system().lower()}_py31210')
+
+MODULES = [
+    'main',
+    'src.utils.data.helper',
+    'src.models.contracts',
+    'src.database.utils.db_manager',
+    'src.neura.client',
+]
+
+
+def measure(module: str) -> tuple[int, list[tuple[int, str]]]:
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        cwd=ROOT,
+        env={**os.environ, 'PYTHONPATH': os.pathsep.join([ROOT, RUNTIME])},
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'import {module} failed:\n{result.stderr}')
+
+    # import time: self [us] | cumulative | imported package
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imports.append((int(cumulative), name.rstrip()))
+
+    total = next(cumulative for cumulative, name in reversed(imports) if name.strip() == module)
+    return total, imports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure import time of the project modules with python -X importtime')
+    parser.add_argument('modules', nargs='*', default=MODULES)
+    parser.add_argument('--top', type=int, default=10, help='Show N slowest imports for every module')
+    parser.add_argument('--max-ms', type=float, help='Exit with status 1 if any module imports slower than this')
+    args = parser.parse_args()
+
+    slow = []
+    for module in args.modules:
+        total, imports = measure(module)
+        print(f'{module}: {total / 1000:.1f} ms')
+        for cumulative, name in sorted(imports, reverse=True)[1:args.top + 1]:
+            print(f'    {cumulative / 1000:8.1f} ms  {name.strip()}')
+
+        if args.max_ms is not None and total / 1000 > args.max_ms:
+            slow.append(module)
+
+    if slow:
+        print(f'Slower than {args.max_ms} ms: {", ".join(slow)}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic import BaseModel, validator, Field, root_validator
 
 from src.database.models import (
@@ -29,3 +31,8 @@ class DataBaseManagerConfig(BaseModel):
         values['calculated_table_object'] = table_mapping[action]
 
         return values
+
+
+@lru_cache(maxsize=None)
+def get_manager_config(action: str) -> DataBaseManagerConfig:
+    return DataBaseManagerConfig(action=action)
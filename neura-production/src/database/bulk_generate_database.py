@@ -0,0 +1,109 @@
+import random
+from asyncio import get_running_loop, gather
+from typing import Optional
+
+from eth_account import Account
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+from loguru import logger
+
+from config import DB_GENERATION_BATCH_SIZE
+from src.database.generate_database import clear_database
+from src.database.models import WorkingWallets, WalletsTasks
+from src.utils.data.mappings import get_enabled_modules
+from src.utils.encryption import encrypt_data, get_crypto_executor
+from src.utils.password import password_source
+
+
+def derive_address(private_key: str) -> Optional[str]:
+    try:
+        return Account.from_key(private_key).address
+    except Exception:
+        return None
+
+
+def prepare_wallet(private_key: str, password: str) -> Optional[tuple[str, bytes, bytes]]:
+    address = derive_address(private_key)
+    if address is None:
+        return None
+
+    salt, encrypted_key = encrypt_data(private_key, password)
+    return address, salt, encrypted_key
+
+
+def get_wallet_tasks(enabled_modules: list[str]) -> list[str]:
+    first_tasks = [task for task in ('FAUCET', 'BRIDGE') if task in enabled_modules]
+    other_tasks = [task for task in enabled_modules if task not in first_tasks]
+    random.shuffle(other_tasks)
+    return first_tasks + other_tasks
+
+
+async def insert_wallets(
+        engine: AsyncEngine,
+        private_keys: list[str],
+        proxies: list[Optional[str]],
+        enabled_modules: list[str],
+        password: str,
+) -> int:
+    loop = get_running_loop()
+    executor = get_crypto_executor()
+    added = 0
+
+    for offset in range(0, len(private_keys), DB_GENERATION_BATCH_SIZE):
+        batch = private_keys[offset:offset + DB_GENERATION_BATCH_SIZE]
+        prepared = await gather(*[
+            loop.run_in_executor(executor, prepare_wallet, private_key, password)
+            for private_key in batch
+        ])
+
+        wallets_rows, tasks_rows = [], []
+        for index, wallet in enumerate(prepared, start=offset):
+            if wallet is None:
+                logger.error(f'Invalid private key #{index + 1}, skipping')
+                continue
+
+            address, salt, encrypted_key = wallet
+            wallets_rows.append({
+                'private_key': encrypted_key,
+                'address': address,
+                'salt': salt,
+                'proxy': (proxies[index % len(proxies)] or None) if proxies else None,
+                'status': 'pending',
+            })
+            tasks_rows.extend(
+                {'private_key': encrypted_key, 'address': address, 'task_name': task, 'status': 'pending'}
+                for task in get_wallet_tasks(enabled_modules)
+            )
+
+        if wallets_rows:
+            async with engine.begin() as conn:
+                await conn.execute(insert(WorkingWallets), wallets_rows)
+                if tasks_rows:
+                    await conn.execute(insert(WalletsTasks), tasks_rows)
+
+        added += len(wallets_rows)
+        logger.info(f'💾 | Added {added}/{len(private_keys)} wallets to DataBase')
+
+    return added
+
+
+async def bulk_generate_database(
+        engine: AsyncEngine,
+        private_keys: list[str],
+        proxies: list[Optional[str]]
+) -> None:
+    private_keys = [private_key for private_key in private_keys if private_key]
+    if not private_keys:
+        logger.error('No private keys found in data/wallets.txt')
+        return
+
+    enabled_modules = get_enabled_modules()
+    if not enabled_modules:
+        logger.warning('No modules are enabled in config.py, wallets will be added without tasks')
+
+    await clear_database(engine)
+
+    password = password_source.ask("🔐 Введите пароль для шифрования приватных ключей:")
+
+    added = await insert_wallets(engine, private_keys, proxies, enabled_modules, password)
+    logger.success(f'Generated new database with {added} wallets and tasks: {", ".join(enabled_modules)}')
@@ -0,0 +1,57 @@
+from sqlalchemy import Index, inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from loguru import logger
+
+from src.database.models import WalletsTasks, WorkingWallets
+
+# Declared here rather than in models.py; creating the Index objects attaches them to the
+# mapped tables, so fresh databases get them from metadata.create_all as well
+wallets_tasks_unique_task = Index(
+    'uq_wallets_tasks_private_key_task_name',
+    WalletsTasks.private_key,
+    WalletsTasks.task_name,
+    unique=True
+)
+wallets_tasks_status = Index(
+    'ix_wallets_tasks_private_key_status',
+    WalletsTasks.private_key,
+    WalletsTasks.status
+)
+working_wallets_status = Index(
+    'ix_working_wallets_status',
+    WorkingWallets.status
+)
+
+
+def _remove_duplicate_tasks(connection: Connection) -> None:
+    table = WalletsTasks.__tablename__
+    result = connection.execute(text(
+        f'DELETE FROM {table} WHERE rowid NOT IN '
+        f'(SELECT MIN(rowid) FROM {table} GROUP BY private_key, task_name)'
+    ))
+    if result.rowcount:
+        logger.warning(f'Removed {result.rowcount} duplicated task rows from {table}')
+
+
+def _create_indexes(connection: Connection) -> None:
+    inspector = inspect(connection)
+    existing_indexes = {
+        index['name']
+        for table in (WalletsTasks.__tablename__, WorkingWallets.__tablename__)
+        for index in inspector.get_indexes(table)
+    }
+
+    for index in (wallets_tasks_unique_task, wallets_tasks_status, working_wallets_status):
+        if index.name in existing_indexes:
+            continue
+
+        if index is wallets_tasks_unique_task:
+            _remove_duplicate_tasks(connection)
+        index.create(connection)
+        logger.debug(f'Created index {index.name}')
+
+
+async def apply_migrations(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(_create_indexes)
@@ -0,0 +1,102 @@
+from asyncio import get_running_loop, gather
+from collections import defaultdict
+from typing import Optional
+
+from sqlalchemy import select, update, bindparam
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncEngine
+from loguru import logger
+
+from src.database.bulk_generate_database import derive_address, get_wallet_tasks, insert_wallets
+from src.database.models import WorkingWallets, WalletsTasks
+from src.utils.data.mappings import get_enabled_modules
+from src.utils.encryption import get_crypto_executor
+from src.utils.password import password_source
+from src.utils.retrieve_route import ask_decryption_password
+
+
+async def add_enabled_modules(engine: AsyncEngine, wallets: list, enabled_modules: list[str]) -> int:
+    async with engine.connect() as conn:
+        result = await conn.execute(select(WalletsTasks.private_key, WalletsTasks.task_name))
+        existing_tasks = defaultdict(set)
+        for private_key, task_name in result:
+            existing_tasks[private_key].add(task_name)
+
+    tasks_rows, reopened_wallets = [], []
+    for wallet in wallets:
+        missing_modules = [
+            module for module in enabled_modules if module not in existing_tasks[wallet.private_key]
+        ]
+        if not missing_modules:
+            continue
+
+        tasks_rows.extend(
+            {'private_key': wallet.private_key, 'address': wallet.address, 'task_name': task, 'status': 'pending'}
+            for task in get_wallet_tasks(missing_modules)
+        )
+        reopened_wallets.append({'wallet_private_key': wallet.private_key})
+
+    if tasks_rows:
+        async with engine.begin() as conn:
+            await conn.execute(sqlite_insert(WalletsTasks).on_conflict_do_nothing(), tasks_rows)
+            await conn.execute(
+                update(WorkingWallets)
+                .where(WorkingWallets.private_key == bindparam('wallet_private_key'))
+                .values(status='pending'),
+                reopened_wallets
+            )
+
+    return len(reopened_wallets)
+
+
+async def sync_database(
+        engine: AsyncEngine,
+        private_keys: list[str],
+        proxies: list[Optional[str]]
+) -> None:
+    enabled_modules = get_enabled_modules()
+
+    async with engine.connect() as conn:
+        result = await conn.execute(
+            select(WorkingWallets.private_key, WorkingWallets.salt, WorkingWallets.address)
+        )
+        wallets = result.all()
+
+    known_addresses = {wallet.address.lower() for wallet in wallets}
+
+    loop = get_running_loop()
+    executor = get_crypto_executor()
+    file_keys = [
+        (index, private_key) for index, private_key in enumerate(private_keys) if private_key
+    ]
+    addresses = await gather(*[
+        loop.run_in_executor(executor, derive_address, private_key) for _, private_key in file_keys
+    ])
+
+    new_keys, new_proxies, seen = [], [], set()
+    for (index, private_key), address in zip(file_keys, addresses):
+        if address is None:
+            logger.error(f'Invalid private key #{index + 1}, skipping')
+            continue
+        if address.lower() in known_addresses or address.lower() in seen:
+            continue
+
+        seen.add(address.lower())
+        new_keys.append(private_key)
+        new_proxies.append(proxies[index % len(proxies)] if proxies else None)
+
+    added = 0
+    if new_keys:
+        if wallets:
+            password = await ask_decryption_password(wallets[0].private_key, wallets[0].salt)
+        else:
+            password = password_source.ask("🔐 Введите пароль для шифрования приватных ключей:")
+
+        added = await insert_wallets(engine, new_keys, new_proxies, enabled_modules, password)
+
+    reopened = await add_enabled_modules(engine, wallets, enabled_modules)
+
+    logger.success(
+        f'Database synced: {added} new wallets added, '
+        f'{reopened} existing wallets got newly enabled modules'
+    )
@@ -1,5 +1,6 @@
 import types
 import asyncio
+from functools import lru_cache
 
 from typing import (
     Optional,
@@ -7,16 +8,34 @@ from typing import (
 )
 
 from eth_typing import ChecksumAddress
-from sqlalchemy import select
+from sqlalchemy import select, update, and_, literal_column, event
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.sql import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import sessionmaker
 from loguru import logger
 
-from src.database.base_models.pydantic_manager import DataBaseManagerConfig
+from config import DB_SYNCHRONOUS
+from src.database.base_models.pydantic_manager import DataBaseManagerConfig, get_manager_config
 from src.database.models import engine, WorkingWallets, WalletsTasks
 
 
+@event.listens_for(engine.sync_engine, 'connect')
+def set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute(f'PRAGMA synchronous={DB_SYNCHRONOUS}')
+    cursor.execute('PRAGMA busy_timeout=30000')
+    cursor.close()
+
+
+async_session = sessionmaker(
+    bind=engine,
+    class_=AsyncSession,
+    expire_on_commit=False
+)
+
+
 class DataBaseUtils:
     db_lock = asyncio.Lock()
 
@@ -24,11 +43,7 @@ class DataBaseUtils:
             self,
             manager_config: DataBaseManagerConfig
     ) -> None:
-        self.session = sessionmaker(
-            bind=engine,
-            class_=AsyncSession,
-            expire_on_commit=False
-        )
+        self.session = async_session
         self.table_object = manager_config.calculated_table_object
 
     async def __aenter__(self) -> 'DataBaseUtils':
@@ -52,36 +67,30 @@ class DataBaseUtils:
     ) -> None:
         async with self.db_lock:
             async with self.session() as session:
-                query = select(self.table_object).filter_by(private_key=private_key)
-
-                if task_name and self.table_object is WalletsTasks:
-                    query = query.filter_by(task_name=task_name)
-
-                result = await session.execute(query)
-                existing_entry = result.scalars().first()
-
-                if existing_entry:
-                    existing_entry.status = status
-                    logger.info(f'🔄 | Updated existing entry '
-                                f'with private_key={private_key[:4]}...{private_key[-4:]} and task_name={task_name}')
-                else:
-                    transaction = self.table_object(
-                        address=address,
-                        private_key=private_key,
-                        status=status
+                if self.table_object is WalletsTasks:
+                    await self.upsert_tasks(session, [(private_key, address, task_name)], status=status)
+                    logger.success(
+                        f'✔️ | Saved entry to DataBase with private_key={private_key[:4]}...{private_key[-4:]} '
+                        f'and task_name={task_name}, status={status}'
                     )
-                    if self.table_object is WorkingWallets:
-                        transaction.salt = salt
-                        transaction.proxy = proxy
-
-                    if self.table_object is WalletsTasks:
-                        transaction.task_name = task_name
-
-                    session.add(transaction)
-                    if task_name:
-                        logger.success(
-                            f'✔️ | Successfully added new entry to DataBase '
-                            f'with private_key={private_key[:4]}...{private_key[-4:]} and task_name={task_name}'
+                else:
+                    query = select(self.table_object).filter_by(private_key=private_key)
+                    result = await session.execute(query)
+                    existing_entry = result.scalars().first()
+
+                    if existing_entry:
+                        existing_entry.status = status
+                        logger.info(f'🔄 | Updated existing entry '
+                                    f'with private_key={private_key[:4]}...{private_key[-4:]}')
+                    else:
+                        session.add(
+                            self.table_object(
+                                address=address,
+                                private_key=private_key,
+                                salt=salt,
+                                proxy=proxy,
+                                status=status
+                            )
                         )
 
                 await session.commit()
@@ -89,27 +98,64 @@ class DataBaseUtils:
                 if self.table_object is WalletsTasks and status == 'completed':
                     await self.check_and_update_working_wallets(private_key, session)
 
+    async def complete_tasks(self, entries: list[tuple[bytes, ChecksumAddress, str]]) -> None:
+        async with self.db_lock:
+            async with self.session() as session:
+                await self.upsert_tasks(session, entries, status='completed')
+                completed_wallets = await self.complete_finished_wallets(
+                    session, [private_key for private_key, _, _ in entries]
+                )
+                await session.commit()
+
+        logger.info(f'💾 | Saved {len(entries)} completed tasks to DataBase, '
+                    f'{completed_wallets} wallets marked as completed')
+
+    @staticmethod
+    async def upsert_tasks(
+            session: AsyncSession,
+            entries: list[tuple[bytes, ChecksumAddress, str]],
+            *,
+            status: str
+    ) -> None:
+        query = sqlite_insert(WalletsTasks)
+        query = query.on_conflict_do_update(
+            index_elements=[WalletsTasks.private_key, WalletsTasks.task_name],
+            set_={'status': query.excluded.status}
+        )
+        await session.execute(
+            query,
+            [
+                {'private_key': private_key, 'address': address, 'task_name': task_name, 'status': status}
+                for private_key, address, task_name in entries
+            ]
+        )
+
+    @staticmethod
+    async def complete_finished_wallets(session: AsyncSession, private_keys: list[bytes]) -> int:
+        has_pending_tasks = select(WalletsTasks.private_key).where(
+            WalletsTasks.private_key == WorkingWallets.private_key,
+            WalletsTasks.status == 'pending'
+        ).exists()
+        query = update(WorkingWallets).where(
+            WorkingWallets.private_key.in_(set(private_keys)),
+            WorkingWallets.status != 'completed',
+            ~has_pending_tasks
+        ).values(status='completed').execution_options(synchronize_session=False)
+
+        result = await session.execute(query)
+        return result.rowcount
+
     async def get_tasks_info(self, private_key: bytes) -> tuple[list[str], list[str]]:
         completed_tasks = await self.get_wallet_completed_tasks(private_key)
         uncompleted_tasks = await self.get_wallet_pending_tasks(private_key)
         return completed_tasks, uncompleted_tasks
 
     @staticmethod
-    async def check_and_update_working_wallets(private_key: str, session) -> None:
-        query = select(WalletsTasks).filter_by(private_key=private_key, status='pending')
-        result = await session.execute(query)
-        pending_tasks = result.scalars().all()
-
-        if not pending_tasks:
-            query = select(WorkingWallets).filter_by(private_key=private_key)
-            result = await session.execute(query)
-            working_wallet = result.scalars().first()
-
-            if working_wallet:
-                working_wallet.status = 'completed'
-                await session.commit()
-                logger.info(f'✔️ | Updated working_wallets entry to completed for '
-                            f'private_key={private_key[:4]}...{private_key[-4:]}')
+    async def check_and_update_working_wallets(private_key: bytes, session: AsyncSession) -> None:
+        if await DataBaseUtils.complete_finished_wallets(session, [private_key]):
+            await session.commit()
+            logger.info(f'✔️ | Updated working_wallets entry to completed for '
+                        f'private_key={private_key[:4]}...{private_key[-4:]}')
 
     async def get_uncompleted_wallets(self):
         async with self.session() as session:
@@ -119,6 +165,29 @@ class DataBaseUtils:
 
         return wallets
 
+    async def get_uncompleted_wallets_with_tasks(self) -> list[tuple[WorkingWallets, list[str]]]:
+        async with self.session() as session:
+            query = select(WorkingWallets, WalletsTasks.task_name).outerjoin(
+                WalletsTasks,
+                and_(
+                    WalletsTasks.private_key == WorkingWallets.private_key,
+                    WalletsTasks.status == 'pending'
+                )
+            ).filter(WorkingWallets.status == 'pending').order_by(
+                literal_column(f'{WorkingWallets.__tablename__}.rowid'),
+                literal_column(f'{WalletsTasks.__tablename__}.rowid')
+            )
+            result = await session.execute(query)
+            rows = result.all()
+
+        wallets: dict[bytes, tuple[WorkingWallets, list[str]]] = {}
+        for wallet, task_name in rows:
+            _, tasks = wallets.setdefault(wallet.private_key, (wallet, []))
+            if task_name is not None:
+                tasks.append(task_name)
+
+        return list(wallets.values())
+
     async def get_wallet_pending_tasks(self, private_key: bytes) -> list[str]:
         async with self.session() as session:
             query = select(WalletsTasks).filter_by(private_key=private_key, status='pending')
@@ -146,3 +215,8 @@ class DataBaseUtils:
             query = select(func.count()).select_from(WorkingWallets)
             result = await session.execute(query)
             return result.scalar()
+
+
+@lru_cache(maxsize=None)
+def get_db_utils(action: str) -> DataBaseUtils:
+    return DataBaseUtils(manager_config=get_manager_config(action))
@@ -0,0 +1,44 @@
+import asyncio
+
+from eth_typing import ChecksumAddress
+from loguru import logger
+
+from config import (
+    DB_WRITE_BATCH_SIZE,
+    DB_FLUSH_INTERVAL,
+    RETRIES,
+    PAUSE_BETWEEN_RETRIES,
+)
+from src.database.utils.db_manager import get_db_utils
+from src.utils.batch_queue import BatchQueue
+
+
+class TaskWriteQueue:
+    def __init__(self, batch_size: int, flush_interval: float) -> None:
+        self._batches = BatchQueue(self._flush, batch_size=batch_size, flush_interval=flush_interval)
+
+    async def put(self, private_key: bytes, address: ChecksumAddress, task_name: str) -> None:
+        await self._batches.put((private_key, address, task_name))
+
+    async def close(self) -> None:
+        await self._batches.close()
+
+    @staticmethod
+    async def _flush(batch: list[tuple[bytes, ChecksumAddress, str]]) -> None:
+        db_utils = get_db_utils('wallets_tasks')
+
+        for attempt in range(RETRIES + 1):
+            try:
+                await db_utils.complete_tasks(batch)
+                return
+            except Exception as ex:
+                if attempt == RETRIES:
+                    logger.error(f'Failed to save {len(batch)} completed tasks after {RETRIES} retries: {ex}')
+                    return
+                await asyncio.sleep(PAUSE_BETWEEN_RETRIES)
+
+
+task_write_queue = TaskWriteQueue(
+    batch_size=DB_WRITE_BATCH_SIZE,
+    flush_interval=DB_FLUSH_INTERVAL
+)
@@ -1,21 +1,86 @@
-from dataclasses import dataclass
+from __future__ import annotations
+
+import json
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from web3 import AsyncWeb3
+    from web3.contract import AsyncContract
+    from web3.contract.async_contract import AsyncContractFunction, AsyncContractFunctions
+
+
+@lru_cache
+def load_abi(path: str) -> str:
+    with open(path, 'r') as file:
+        return file.read()
+
+
+@lru_cache
+def parse_abi(abi: str) -> list[dict]:
+    return json.loads(abi)
+
+
+@lru_cache
+def get_template_contract(address: str, abi: str) -> AsyncContract:
+    from web3 import AsyncWeb3
+
+    # built once per process, requests never go through this web3: every function is bound to the caller's web3
+    web3 = AsyncWeb3()
+    return web3.eth.contract(address=web3.to_checksum_address(address), abi=parse_abi(abi))
+
+
+class BoundFunctions:
+    def __init__(self, functions: AsyncContractFunctions, web3: AsyncWeb3) -> None:
+        self._functions = functions
+        self._web3 = web3
+
+    def __getattr__(self, name: str) -> Callable[..., AsyncContractFunction]:
+        function = getattr(self._functions, name)
+
+        def bind(*args: Any, **kwargs: Any) -> AsyncContractFunction:
+            # every call returns a fresh copy of the function, so setting w3 on it does not touch the template
+            bound = function(*args, **kwargs)
+            bound.w3 = self._web3
+            return bound
+
+        return bind
+
+
+class BoundContract:
+    def __init__(self, contract: AsyncContract, web3: AsyncWeb3) -> None:
+        self._contract = contract
+        self.w3 = web3
+        self.functions = BoundFunctions(contract.functions, web3)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._contract, name)
+
+
+def get_contract(web3: AsyncWeb3, address: str, abi: str) -> BoundContract:
+    return BoundContract(get_template_contract(address, abi), web3)
+
+
+class AbiFile:
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def __get__(self, instance, owner) -> str:
+        return load_abi(self.path)
 
 
-@dataclass
 class ERC20:
-    abi: str = open('./assets/abi/erc20.json', 'r').read()
+    abi = AbiFile('./assets/abi/erc20.json')
 
 
-@dataclass
 class BridgeData:
     address: str = '0xc6255a594299F1776de376d0509aB5ab875A6E3E'
-    abi: str = open('./assets/abi/bridge.json', 'r').read()
+    abi = AbiFile('./assets/abi/bridge.json')
 
 
-@dataclass
 class SwapData:
     router_address: str = '0x5AeFBA317BAba46EAF98Fd6f381d07673bcA6467'
-    router_abi: str = open('./assets/abi/router.json', 'r').read()
+    router_abi = AbiFile('./assets/abi/router.json')
 
     quoter_address: str = '0xE94de02e52Eaf9F0f6Bf7f16E4927FcBc2c09bC7'
-    quoter_abi: str = open('./assets/abi/quoter.json', 'r').read()
+    quoter_abi = AbiFile('./assets/abi/quoter.json')
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
-from typing import List, Any
+from typing import List, Any, Optional
 
 from eth_typing import ChecksumAddress
 from pydantic import BaseModel, model_validator, Field
 
+from src.utils.encryption import decrypt_data_async
 from src.utils.proxy_manager import Proxy
 
 
 class Wallet(BaseModel):
     encrypted_key: bytes
-    private_key: str
+    salt: bytes
     address: ChecksumAddress
+    private_key: Optional[str] = None
 
     proxy: Any | None = Field(init=False)
 
@@ -28,6 +30,14 @@ class Wallet(BaseModel):
 
         return values
 
+    async def unlock(self, password: str) -> str:
+        if self.private_key is None:
+            self.private_key = await decrypt_data_async(self.encrypted_key, password, self.salt)
+        return self.private_key
+
+    def lock(self) -> None:
+        self.private_key = None
+
 
 class Route(BaseModel):
     tasks: List[str]
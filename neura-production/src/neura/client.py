@@ -1,14 +1,15 @@
 import json
 import random
 import uuid
-from asyncio import sleep
+from asyncio import sleep, gather
+from contextlib import suppress
 from datetime import datetime, timezone
 from typing import Optional
 
 from loguru import logger
 
 from config import RETRIES, PAUSE_BETWEEN_RETRIES
-from src.models.contracts import BridgeData, SwapData
+from src.models.contracts import BridgeData, SwapData, ERC20
 from src.neura.tx_utils import create_swap_tx
 from src.neura.types import UserData
 from src.utils.cherry_solver.client import CherrySolver
@@ -18,6 +19,8 @@ from src.utils.data.tokens import tokens
 from src.utils.proxy_manager import Proxy
 from src.utils.request_client.curl_cffi_client import CurlCffiClient
 from src.utils.user.account import Account
+from src.utils.user.gas_oracle import gas_oracle
+from src.utils.user.nonce_manager import nonce_manager
 
 
 class NeuraClient(Account, CurlCffiClient):
@@ -76,6 +79,10 @@ class NeuraClient(Account, CurlCffiClient):
         CurlCffiClient.__init__(self, proxy=self.proxy)
         self._cherry_solver = CherrySolver(session=self.session, proxy=self.proxy, verbose=False)
 
+    async def close(self) -> None:
+        with suppress(Exception):
+            await CurlCffiClient.close(self)
+
     @retry(retries=RETRIES, delay=PAUSE_BETWEEN_RETRIES, backoff=1.5)
     async def _get_nonce(self) -> Optional[str]:
         turnstile_token = await self._cherry_solver.solve_captcha(
@@ -293,7 +300,7 @@ class NeuraClient(Account, CurlCffiClient):
         if not bridge_visited:
             return None
 
-        sepolia_account = Account(private_key=self.private_key, rpc=SEPOLIA.rpc, proxy=self.proxy)
+        sepolia_account = Account(private_key=self.private_key, chain=SEPOLIA, proxy=self.proxy)
 
         native_balance = await sepolia_account.get_wallet_balance(is_native=True)
         if native_balance == 0:
@@ -304,7 +311,7 @@ class NeuraClient(Account, CurlCffiClient):
             is_native=False, address='0xB88Ca91Fef0874828e5ea830402e9089aaE0bB7F'
         )
 
-        await sepolia_account.approve_token(
+        approved = await sepolia_account.approve_token(
             amount=sepolia_ankr_balance,
             private_key=self.private_key,
             from_token_address='0xB88Ca91Fef0874828e5ea830402e9089aaE0bB7F',
@@ -312,6 +319,9 @@ class NeuraClient(Account, CurlCffiClient):
             address_wallet=self.wallet_address,
             web3=sepolia_account.web3
         )
+        if not approved:
+            logger.error(f'[{self.wallet_address}] | ANKR is not approved for the bridge, skipping bridge')
+            return None
 
         bridge_contract = self.load_contract(
             address=BridgeData.address,
@@ -319,16 +329,22 @@ class NeuraClient(Account, CurlCffiClient):
             web3=sepolia_account.web3
         )
 
-        tx = await bridge_contract.functions.deposit(
-            sepolia_ankr_balance,
-            self.wallet_address
-        ).build_transaction({
-            'value': 0,
-            'nonce': await sepolia_account.web3.eth.get_transaction_count(self.wallet_address),
-            'from': self.wallet_address,
-            'gasPrice': await sepolia_account.web3.eth.gas_price
-        })
-        tx_hash = await sepolia_account.sign_transaction(tx)
+        chain_id, fees = await gather(
+            sepolia_account.get_chain_id(),
+            gas_oracle.get_fees(sepolia_account.web3, SEPOLIA.chain_id)
+        )
+        async with nonce_manager.reserve(sepolia_account.web3, SEPOLIA.chain_id, self.wallet_address) as nonce:
+            tx = await bridge_contract.functions.deposit(
+                sepolia_ankr_balance,
+                self.wallet_address
+            ).build_transaction({
+                'chainId': chain_id,
+                'value': 0,
+                'nonce': nonce,
+                'from': self.wallet_address,
+                **fees.as_tx_params()
+            })
+            tx_hash = await sepolia_account.sign_transaction(tx)
         confirmed = await sepolia_account.wait_until_tx_finished(tx_hash)
         if confirmed and tx_hash:
             logger.success(
@@ -348,31 +364,45 @@ class NeuraClient(Account, CurlCffiClient):
             web3=self.web3
         )
         is_native = from_token == 'ANKR'
-        balance = await self.get_wallet_balance(
-            is_native=is_native, address=tokens['NEURA'][from_token]
-        )
+        if is_native:
+            balance = await self.get_wallet_balance(is_native=True)
+        else:
+            token_contract = self.load_contract(tokens['NEURA'][from_token], self.web3, ERC20.abi)
+            balance, allowance_amount = await self.batch_read(
+                self.web3,
+                lambda: token_contract.functions.balanceOf(self.wallet_address),
+                lambda: token_contract.functions.allowance(
+                    self.wallet_address, self.web3.to_checksum_address(SwapData.router_address)
+                )
+            )
         amount = int(balance * swap_percentage)
 
         if not is_native:
-            await self.approve_token(
+            approved = await self.approve_token(
                 amount=amount,
                 private_key=self.private_key,
                 from_token_address=tokens['NEURA'][from_token],
                 spender=SwapData.router_address,
                 address_wallet=self.wallet_address,
-                web3=self.web3
+                web3=self.web3,
+                allowance_amount=allowance_amount
             )
-
-        tx = await create_swap_tx(
-            self,
-            from_token_name=from_token,
-            to_token_name=to_token,
-            from_token_address=tokens['NEURA'][from_token] if not from_token == 'ANKR' else tokens['NEURA']['WANKR'],
-            to_token_address=tokens['NEURA'][to_token] if not to_token == 'ANKR' else tokens['NEURA']['WANKR'],
-            contract=contract,
-            amount=amount
-        )
-        tx_hash = await self.sign_transaction(tx)
+            if not approved:
+                logger.error(f'[{self.wallet_address}] | {from_token} is not approved for the router, skipping swap')
+                return None
+
+        async with nonce_manager.reserve(self.web3, self.chain.chain_id, self.wallet_address) as nonce:
+            tx = await create_swap_tx(
+                self,
+                from_token_name=from_token,
+                to_token_name=to_token,
+                from_token_address=tokens['NEURA'][from_token] if not from_token == 'ANKR' else tokens['NEURA']['WANKR'],
+                to_token_address=tokens['NEURA'][to_token] if not to_token == 'ANKR' else tokens['NEURA']['WANKR'],
+                contract=contract,
+                amount=amount,
+                nonce=nonce
+            )
+            tx_hash = await self.sign_transaction(tx)
         confirmed = await self.wait_until_tx_finished(tx_hash)
         if confirmed and tx_hash:
             logger.success(
@@ -1,10 +1,12 @@
+from asyncio import gather
 from time import time
 from typing import Iterable
 
-from web3.contract import AsyncContract
+from web3.contract.async_contract import AsyncContractFunction
 from web3.types import TxParams
 
-from src.models.contracts import SwapData
+from src.models.contracts import BoundContract, SwapData
+from src.utils.user.gas_oracle import gas_oracle
 
 
 def _normalize_addr(addr: str) -> str:
@@ -45,14 +47,14 @@ def get_path(from_token_address: str, to_token_address: str, from_token_name: st
     return _encode_path(from_token_address, to_token_address)
 
 
-async def get_min_amount_out(
+def get_quote(
         self,
         from_token_address: str,
         to_token_address: str,
         from_token_name: str,
         to_token_name: str,
         amount: int
-):
+) -> AsyncContractFunction:
     quoter = self.load_contract(
         address=SwapData.quoter_address,
         abi=SwapData.quoter_abi,
@@ -64,10 +66,14 @@ async def get_min_amount_out(
         from_token_name=from_token_name,
         to_token_name=to_token_name
     )
-    min_amount_out, _, _, _, _, _ = await quoter.functions.quoteExactInput(
+    return quoter.functions.quoteExactInput(
         path,
         amount
-    ).call()
+    )
+
+
+def get_min_amount_out(quote: tuple) -> int:
+    min_amount_out, _, _, _, _, _ = quote
     min_amount_out = min_amount_out[0]
     return int(min_amount_out - (min_amount_out / 100 * 20))
 
@@ -78,17 +84,16 @@ async def create_swap_tx(
         to_token_name: str,
         from_token_address: str,
         to_token_address: str,
-        contract: AsyncContract,
+        contract: BoundContract,
         amount: int,
+        nonce: int,
 ) -> TxParams:
-    min_amount_out = await get_min_amount_out(
-        self,
-        from_token_address,
-        to_token_address,
-        from_token_name,
-        to_token_name,
-        amount
+    quote, fees, chain_id = await gather(
+        get_quote(self, from_token_address, to_token_address, from_token_name, to_token_name, amount).call(),
+        gas_oracle.get_fees(self.web3, self.chain.chain_id),
+        self.get_chain_id()
     )
+    min_amount_out = get_min_amount_out(quote)
     deadline = int(time() * 1000 + 1800)
     transaction_data = contract.encode_abi(
         abi_element_identifier="exactInputSingle",
@@ -126,10 +131,11 @@ async def create_swap_tx(
     tx = await contract.functions.multicall(
         [transaction_data]
     ).build_transaction({
+        'chainId': chain_id,
         'value': amount if from_token_name == 'ANKR' else 0,
-        'nonce': await self.web3.eth.get_transaction_count(self.wallet_address),
+        'nonce': nonce,
         'from': self.wallet_address,
-        'gasPrice': int(await self.web3.eth.gas_price * 1.2),
+        **fees.as_tx_params(multiplier=1.2),
         'gas': gas_limit
     })
 
@@ -0,0 +1,71 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+_STOP = object()
+
+
+class BatchQueue:
+    def __init__(
+            self,
+            handler: Callable[[list], Awaitable[None]],
+            batch_size: int,
+            flush_interval: float,
+    ) -> None:
+        self.handler = handler
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None
+
+    def put_nowait(self, item: Any) -> None:
+        self._start()
+        self._queue.put_nowait(item)
+
+    async def put(self, item: Any) -> None:
+        self._start()
+        await self._queue.put(item)
+
+    async def close(self) -> None:
+        if self._worker is None:
+            return
+
+        await self._queue.put(_STOP)
+        await self._worker
+        self._worker = None
+
+    def _start(self) -> None:
+        if self._worker is None:
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+
+            # a batch is handed over once it is full or flush_interval after its first item, whichever comes first
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self.handler(batch)
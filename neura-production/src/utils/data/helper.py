@@ -1,17 +1,26 @@
+from functools import lru_cache
+from typing import Optional
+
 from colorama import Fore
 
-with open('config.py', 'r', encoding='utf-8-sig') as file:
-    module_config = file.read()
 
-exec(module_config)
+def read_lines(path: str) -> list[str]:
+    with open(path, 'r', encoding='utf-8-sig') as file:
+        return [line.strip() for line in file]
 
-with open('data/wallets.txt', 'r', encoding='utf-8-sig') as file:
-    private_keys = [line.strip() for line in file]
 
-with open('data/proxies.txt', 'r', encoding='utf-8-sig') as file:
-    proxies = [line.strip() for line in file]
-    if not proxies:
-        proxies = [None for _ in range(len(private_keys))]
+@lru_cache
+def get_private_keys() -> list[str]:
+    private_keys = read_lines('data/wallets.txt')
+
+    print(Fore.BLUE + f'Loaded {len(private_keys)} wallets:')
+    print('\033[39m')
+    return private_keys
 
-print(Fore.BLUE + f'Loaded {len(private_keys)} wallets:')
-print('\033[39m')
+
+@lru_cache
+def get_proxies() -> list[Optional[str]]:
+    proxies = read_lines('data/proxies.txt')
+    if not proxies:
+        proxies = [None for _ in range(len(get_private_keys()))]
+    return proxies
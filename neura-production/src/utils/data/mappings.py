@@ -1,3 +1,4 @@
+import config
 from src.utils.runner import *
 
 module_handlers = {
@@ -8,3 +9,7 @@ module_handlers = {
     'CLAIM_TASKS': process_claim_tasks,
     'CHAT_WITH_AGENTS': process_chat_with_agents
 }
+
+
+def get_enabled_modules() -> list[str]:
+    return [module for module in module_handlers if getattr(config, module, False)]
@@ -1,10 +1,21 @@
 import base64
+import multiprocessing
 import os
+import signal
+from asyncio import get_running_loop
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
 
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 
+# ProcessPoolExecutor refuses more than 61 workers on Windows
+MAX_CRYPTO_WORKERS = 61
+
+_executor: Optional[ProcessPoolExecutor] = None
+_max_workers = min(os.cpu_count() or 1, MAX_CRYPTO_WORKERS)
+
 
 def derive_key(password: str, salt: bytes) -> bytes:
     kdf = PBKDF2HMAC(
@@ -28,3 +39,38 @@ def decrypt_data(encrypted_data: bytes, password: str, salt: bytes) -> str:
     key = derive_key(password, salt)
     f = Fernet(key)
     return f.decrypt(encrypted_data).decode()
+
+
+def _ignore_sigint() -> None:
+    # Ctrl+C is handled by the main process, workers must survive until it shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def get_crypto_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # created lazily from a running loop with DB threads alive, forking such a process can deadlock the workers
+        _executor = ProcessPoolExecutor(
+            max_workers=_max_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_ignore_sigint
+        )
+    return _executor
+
+
+def limit_crypto_workers(max_workers: int) -> None:
+    global _max_workers
+    _max_workers = max(1, min(max_workers, MAX_CRYPTO_WORKERS))
+
+
+def shutdown_crypto_executor() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(cancel_futures=True)
+        _executor = None
+
+
+async def decrypt_data_async(encrypted_data: bytes, password: str, salt: bytes) -> str:
+    return await get_running_loop().run_in_executor(
+        get_crypto_executor(), decrypt_data, encrypted_data, password, salt
+    )
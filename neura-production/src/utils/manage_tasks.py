@@ -1,15 +1,16 @@
 from eth_typing import ChecksumAddress
 
-from src.database.base_models.pydantic_manager import DataBaseManagerConfig
-from src.database.utils.db_manager import DataBaseUtils
+from config import DB_WRITE_MODE
+from src.database.utils.db_manager import get_db_utils
+from src.database.utils.write_queue import task_write_queue
 
 
 async def manage_tasks(private_key: bytes, address: ChecksumAddress, task: str) -> None:
-    db_utils = DataBaseUtils(
-        manager_config=DataBaseManagerConfig(
-            action='wallets_tasks'
-        )
-    )
+    if DB_WRITE_MODE == 'batched':
+        await task_write_queue.put(private_key, address, task)
+        return
+
+    db_utils = get_db_utils('wallets_tasks')
 
     await db_utils.add_to_db(
         private_key=private_key,
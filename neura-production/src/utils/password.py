@@ -0,0 +1,88 @@
+import os
+from getpass import getpass
+from typing import Optional
+
+from loguru import logger
+
+try:
+    import keyring
+except ImportError:
+    keyring = None
+
+PASSWORD_ENV = 'NEURA_DB_PASSWORD'
+KEYRING_USER = 'database'
+
+
+class PasswordSource:
+    def __init__(self) -> None:
+        self.env: Optional[str] = PASSWORD_ENV
+        self.fd: Optional[int] = None
+        self.keyring_service: Optional[str] = None
+        self.keyring_user = KEYRING_USER
+
+        self._password: Optional[str] = None
+        self._resolved = False
+
+    def configure(
+            self,
+            env: Optional[str] = PASSWORD_ENV,
+            fd: Optional[int] = None,
+            keyring_service: Optional[str] = None,
+            keyring_user: str = KEYRING_USER,
+    ) -> None:
+        self.env = env
+        self.fd = fd
+        self.keyring_service = keyring_service
+        self.keyring_user = keyring_user
+        self._password = None
+        self._resolved = False
+
+    @property
+    def name(self) -> str:
+        if self.fd is not None:
+            return f'file descriptor {self.fd}'
+        if self.env and os.getenv(self.env):
+            return f'environment variable {self.env}'
+        if self.keyring_service:
+            return f'keyring {self.keyring_service}/{self.keyring_user}'
+        return 'prompt'
+
+    @property
+    def interactive(self) -> bool:
+        return self.get_stored() is None
+
+    def get_stored(self) -> Optional[str]:
+        if not self._resolved:
+            self._password = self._read()
+            self._resolved = True
+        return self._password
+
+    def ask(self, prompt: str) -> str:
+        password = self.get_stored()
+        if password is not None:
+            return password
+
+        logger.info(prompt)
+        return getpass(">>> ")
+
+    def _read(self) -> Optional[str]:
+        if self.fd is not None:
+            with os.fdopen(self.fd) as file:
+                return file.readline().rstrip('\r\n')
+
+        if self.env and os.getenv(self.env):
+            return os.environ[self.env]
+
+        if self.keyring_service:
+            if keyring is None:
+                raise RuntimeError('keyring is not installed, run "pip install keyring" or use another password source')
+
+            password = keyring.get_password(self.keyring_service, self.keyring_user)
+            if password is None:
+                raise RuntimeError(f'No password stored in keyring for {self.keyring_service}/{self.keyring_user}')
+            return password
+
+        return None
+
+
+password_source = PasswordSource()
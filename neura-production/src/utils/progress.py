@@ -0,0 +1,22 @@
+from src.database.utils.db_manager import get_db_utils
+
+
+class ProgressTracker:
+    def __init__(self) -> None:
+        self.total_wallets = 0
+        self.completed_wallets = 0
+        self.processed_wallets = 0
+
+    async def seed(self) -> None:
+        db_utils = get_db_utils('working_wallets')
+        self.total_wallets = await db_utils.get_total_wallets_count()
+        self.completed_wallets = await db_utils.get_completed_wallets_count()
+        self.processed_wallets = 0
+
+    def wallet_processed(self, completed: bool) -> None:
+        self.processed_wallets += 1
+        if completed:
+            self.completed_wallets += 1
+
+
+progress_tracker = ProgressTracker()
@@ -1,7 +1,7 @@
 import random
 from typing import Any
 
-from src.utils.data.helper import proxies
+from src.utils.data.helper import get_proxies
 
 
 class Proxy:
@@ -14,7 +14,7 @@ class Proxy:
         self._client = client
 
     def _get_random_proxy(self) -> str:
-        proxy_str = random.choice(proxies)
+        proxy_str = random.choice(get_proxies())
         return f"http://{proxy_str}"
 
     async def change(self):
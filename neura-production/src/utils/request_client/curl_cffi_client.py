@@ -16,6 +16,10 @@ class CurlCffiClient:
             impersonate=BrowserType.chrome131 if platform.system() == 'Windows' else BrowserType.chrome131
         )
 
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+
     async def make_request(
             self,
             method: str = 'GET',
@@ -0,0 +1,108 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Optional
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from web3 import AsyncWeb3
+from web3._utils.http_session_manager import HTTPSessionManager
+from web3.eth import AsyncEth
+from loguru import logger
+
+from config import RPC_CONNECTIONS_LIMIT, RPC_CONNECTIONS_PER_HOST, RPC_CLIENTS_CACHE_SIZE
+from src.utils.data.chains import Chain
+
+
+class ChainIdMismatch(RuntimeError):
+    pass
+
+
+class SharedSessionManager(HTTPSessionManager):
+    def __init__(self, pool: 'Web3Pool') -> None:
+        super().__init__()
+        self.pool = pool
+
+    async def async_cache_and_return_session(
+            self,
+            endpoint_uri: Any,
+            session: Optional[ClientSession] = None,
+            request_timeout: Optional[ClientTimeout] = None,
+    ) -> ClientSession:
+        return self.pool.get_session()
+
+
+class Web3Pool:
+    def __init__(self, limit: int, limit_per_host: int, max_clients: int) -> None:
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.max_clients = max_clients
+
+        # one entry per (rpc, proxy): without a bound the pool would grow with the wallet database
+        self._web3: OrderedDict[tuple[str, Optional[str]], AsyncWeb3] = OrderedDict()
+        self._session: Optional[ClientSession] = None
+        self._chain_checks: dict[str, asyncio.Task] = {}
+        # web3's own sessions use force_close=True, i.e. a new TCP/TLS handshake on every request
+        self._session_manager = SharedSessionManager(self)
+
+    def get(self, rpc: str, proxy_url: Optional[str] = None) -> AsyncWeb3:
+        key = (rpc, proxy_url)
+        web3 = self._web3.get(key)
+        if web3 is not None:
+            self._web3.move_to_end(key)
+        else:
+            request_kwargs = {'verify_ssl': False}
+            if proxy_url:
+                request_kwargs['proxy'] = proxy_url
+
+            provider = AsyncWeb3.AsyncHTTPProvider(endpoint_uri=rpc, request_kwargs=request_kwargs)
+            provider._request_session_manager = self._session_manager
+
+            web3 = AsyncWeb3(provider=provider, modules={'eth': (AsyncEth,)})
+            self._web3[key] = web3
+            # evicted clients stay usable for wallets that already hold them, connections are shared anyway
+            while len(self._web3) > self.max_clients:
+                self._web3.popitem(last=False)
+        return web3
+
+    async def verify_chain(self, web3: AsyncWeb3, chain: Chain) -> None:
+        check = self._chain_checks.get(chain.rpc)
+        failed = check is not None and check.done() and check.exception() is not None
+        # only connection failures are checked again, a wrong chain id stays wrong for the whole run
+        if check is None or (failed and not isinstance(check.exception(), ChainIdMismatch)):
+            check = asyncio.create_task(self._check_chain_id(web3, chain))
+            self._chain_checks[chain.rpc] = check
+
+        await asyncio.shield(check)
+
+    @staticmethod
+    async def _check_chain_id(web3: AsyncWeb3, chain: Chain) -> None:
+        chain_id = await web3.eth.chain_id
+        if chain_id != chain.chain_id:
+            raise ChainIdMismatch(f'RPC {chain.rpc} returned chain id {chain_id}, expected {chain.chain_id}')
+        logger.debug(f'RPC {chain.rpc} | chain id {chain_id} verified')
+
+    def get_session(self) -> ClientSession:
+        if self._session is None or self._session.closed:
+            self._session = ClientSession(
+                raise_for_status=True,
+                connector=TCPConnector(
+                    limit=self.limit,
+                    limit_per_host=self.limit_per_host,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                ),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        self._web3.clear()
+        self._chain_checks.clear()
+
+
+web3_pool = Web3Pool(
+    limit=RPC_CONNECTIONS_LIMIT,
+    limit_per_host=RPC_CONNECTIONS_PER_HOST,
+    max_clients=RPC_CLIENTS_CACHE_SIZE
+)
@@ -1,45 +1,48 @@
-from getpass import getpass
 from typing import List, Optional
 
+from cryptography.fernet import InvalidToken
 from loguru import logger
 
-from src.database.base_models.pydantic_manager import DataBaseManagerConfig
-from src.database.utils.db_manager import DataBaseUtils
+from src.database.utils.db_manager import get_db_utils
 from src.models.route import Route, Wallet
-from src.utils.encryption import decrypt_data
+from src.utils.encryption import decrypt_data_async
+from src.utils.password import password_source
 
 
 async def get_routes() -> Optional[List[Route]]:
-    db_utils = DataBaseUtils(
-        manager_config=DataBaseManagerConfig(
-            action='working_wallets'
-        )
-    )
-    result = await db_utils.get_uncompleted_wallets()
+    db_utils = get_db_utils('working_wallets')
+    result = await db_utils.get_uncompleted_wallets_with_tasks()
     if not result:
         logger.success(f'Все кошельки с данной базы данных уже отработали')
         return None
 
     routes = []
-    logger.info("🔐 Введите пароль для расшифровки приватных ключей:")
-    decryption_password = getpass(">>> ")
-
-    for wallet in result:
-        private_key_tasks = await db_utils.get_wallet_pending_tasks(wallet.private_key)
-        tasks = []
-        for task in private_key_tasks:
-            tasks.append(task.task_name)
-
-        private_key = decrypt_data(wallet.private_key, decryption_password, wallet.salt)
+    for wallet, tasks in result:
         routes.append(
             Route(
                 tasks=tasks,
                 wallet=Wallet(
                     encrypted_key=wallet.private_key,
-                    private_key=private_key,
+                    salt=wallet.salt,
                     address=wallet.address,
                     proxy=wallet.proxy,
                 )
             )
         )
     return routes
+
+
+async def ask_decryption_password(encrypted_key: bytes, salt: bytes) -> str:
+    while True:
+        decryption_password = password_source.ask("🔐 Введите пароль для расшифровки приватных ключей:")
+        try:
+            await decrypt_data_async(encrypted_key, decryption_password, salt)
+        except InvalidToken:
+            if not password_source.interactive:
+                logger.error(f'Неверный пароль ({password_source.name})')
+                raise SystemExit(1)
+
+            logger.error('Неверный пароль, попробуйте ещё раз')
+            continue
+
+        return decryption_password
@@ -1,5 +1,4 @@
 import random
-from asyncio import sleep
 from typing import Optional
 
 from loguru import logger
@@ -7,6 +6,7 @@ from loguru import logger
 from config import PAUSE_BETWEEN_MODULES, CycleSwapSettings, ChatSettings
 from src.models.route import Route
 from src.neura.client import NeuraClient
+from src.utils.scheduler import pause
 
 
 async def process_faucet(route: Route) -> Optional[bool]:
@@ -14,11 +14,14 @@ async def process_faucet(route: Route) -> Optional[bool]:
         private_key=route.wallet.private_key,
         proxy=route.wallet.proxy,
     )
-    authed = await neura_client.authorize()
-    if not authed:
-        return None
+    try:
+        authed = await neura_client.authorize()
+        if not authed:
+            return None
 
-    return await neura_client.request_tokens()
+        return await neura_client.request_tokens()
+    finally:
+        await neura_client.close()
 
 
 async def process_collect_pulses(route: Route) -> Optional[bool]:
@@ -26,14 +29,17 @@ async def process_collect_pulses(route: Route) -> Optional[bool]:
         private_key=route.wallet.private_key,
         proxy=route.wallet.proxy,
     )
-    authed = await neura_client.authorize()
-    if not authed:
-        return None
-    user = await neura_client.get_user()
-    if not user:
-        return None
+    try:
+        authed = await neura_client.authorize()
+        if not authed:
+            return None
+        user = await neura_client.get_user()
+        if not user:
+            return None
 
-    return await neura_client.collect_pulses()
+        return await neura_client.collect_pulses()
+    finally:
+        await neura_client.close()
 
 
 async def process_claim_tasks(route: Route) -> Optional[bool]:
@@ -41,11 +47,14 @@ async def process_claim_tasks(route: Route) -> Optional[bool]:
         private_key=route.wallet.private_key,
         proxy=route.wallet.proxy,
     )
-    authed = await neura_client.authorize()
-    if not authed:
-        return None
+    try:
+        authed = await neura_client.authorize()
+        if not authed:
+            return None
 
-    return await neura_client.claim_tasks()
+        return await neura_client.claim_tasks()
+    finally:
+        await neura_client.close()
 
 
 async def process_bridge(route: Route) -> Optional[bool]:
@@ -53,11 +62,14 @@ async def process_bridge(route: Route) -> Optional[bool]:
         private_key=route.wallet.private_key,
         proxy=route.wallet.proxy,
     )
-    authed = await neura_client.authorize()
-    if not authed:
-        return None
+    try:
+        authed = await neura_client.authorize()
+        if not authed:
+            return None
 
-    return await neura_client.bridge_tokens()
+        return await neura_client.bridge_tokens()
+    finally:
+        await neura_client.close()
 
 
 async def process_chat_with_agents(route: Route) -> Optional[bool]:
@@ -65,40 +77,43 @@ async def process_chat_with_agents(route: Route) -> Optional[bool]:
         private_key=route.wallet.private_key,
         proxy=route.wallet.proxy,
     )
-    authed = await neura_client.authorize()
-    if not authed:
-        return None
-
-    num_messages = random.randint(ChatSettings.num_messages[0], ChatSettings.num_messages[1])
-    start_messages = ChatSettings.greet_messages
-    agents = ['talon', 'borl', 'eldros', 'bullhorn', 'oomi', 'quiver', 'ember',
-              'vimri', 'fenna', 'brama', 'jakar', 'izzy', 'neko']
-
-    previous_message = random.choice(start_messages)
-
-    for i in range(num_messages):
-        current_agent = random.choice(agents)
-        response = await neura_client.send_message(
-            agent=current_agent,
-            message=previous_message
-        )
-        if not response:
-            logger.warning(f"[WARN] No response from agent {current_agent.capitalize()}")
-            await sleep(10)
-            continue
-        elif response == 'RATE_LIMIT':
-            logger.warning(f'[{neura_client.wallet_address}] | Rate limit reached. Sleeping...')
-            await sleep(60)
-            continue
-
-        logger.debug(f"[{current_agent.capitalize()}] → {response}")
-        previous_message = response
-
-        random_sleep = random.randint(PAUSE_BETWEEN_MODULES[0], PAUSE_BETWEEN_MODULES[1])
-        logger.debug(f'[{neura_client.wallet_address}] | Sleeping {random_sleep} seconds before next message...')
-        await sleep(random.randint(PAUSE_BETWEEN_MODULES[0], PAUSE_BETWEEN_MODULES[1]))
-
-    return True
+    try:
+        authed = await neura_client.authorize()
+        if not authed:
+            return None
+
+        num_messages = random.randint(ChatSettings.num_messages[0], ChatSettings.num_messages[1])
+        start_messages = ChatSettings.greet_messages
+        agents = ['talon', 'borl', 'eldros', 'bullhorn', 'oomi', 'quiver', 'ember',
+                  'vimri', 'fenna', 'brama', 'jakar', 'izzy', 'neko']
+
+        previous_message = random.choice(start_messages)
+
+        for i in range(num_messages):
+            current_agent = random.choice(agents)
+            response = await neura_client.send_message(
+                agent=current_agent,
+                message=previous_message
+            )
+            if not response:
+                logger.warning(f"[WARN] No response from agent {current_agent.capitalize()}")
+                await pause(10)
+                continue
+            elif response == 'RATE_LIMIT':
+                logger.warning(f'[{neura_client.wallet_address}] | Rate limit reached. Sleeping...')
+                await pause(60)
+                continue
+
+            logger.debug(f"[{current_agent.capitalize()}] → {response}")
+            previous_message = response
+
+            random_sleep = random.randint(PAUSE_BETWEEN_MODULES[0], PAUSE_BETWEEN_MODULES[1])
+            logger.debug(f'[{neura_client.wallet_address}] | Sleeping {random_sleep} seconds before next message...')
+            await pause(random.randint(PAUSE_BETWEEN_MODULES[0], PAUSE_BETWEEN_MODULES[1]))
+
+        return True
+    finally:
+        await neura_client.close()
 
 
 async def process_cycle_swaps(route: Route) -> Optional[bool]:
@@ -106,39 +121,42 @@ async def process_cycle_swaps(route: Route) -> Optional[bool]:
         private_key=route.wallet.private_key,
         proxy=route.wallet.proxy,
     )
-    authed = await neura_client.authorize()
-    if not authed:
-        return None
+    try:
+        authed = await neura_client.authorize()
+        if not authed:
+            return None
 
-    cycles = random.randint(CycleSwapSettings.cycles[0], CycleSwapSettings.cycles[1])
+        cycles = random.randint(CycleSwapSettings.cycles[0], CycleSwapSettings.cycles[1])
 
-    for _ in range(cycles):
-        token = random.choice(CycleSwapSettings.token)
-        swap_percentage = random.uniform(CycleSwapSettings.swap_percentage[0], CycleSwapSettings.swap_percentage[1])
+        for _ in range(cycles):
+            token = random.choice(CycleSwapSettings.token)
+            swap_percentage = random.uniform(CycleSwapSettings.swap_percentage[0], CycleSwapSettings.swap_percentage[1])
 
-        tx_hash = await neura_client.swap(
-            from_token='ANKR',
-            to_token=token,
-            swap_percentage=swap_percentage
-        )
+            tx_hash = await neura_client.swap(
+                from_token='ANKR',
+                to_token=token,
+                swap_percentage=swap_percentage
+            )
 
-        if tx_hash:
-            random_sleep = random.randint(PAUSE_BETWEEN_MODULES[0], PAUSE_BETWEEN_MODULES[1]) if isinstance(
-                PAUSE_BETWEEN_MODULES, list) else PAUSE_BETWEEN_MODULES
+            if tx_hash:
+                random_sleep = random.randint(PAUSE_BETWEEN_MODULES[0], PAUSE_BETWEEN_MODULES[1]) if isinstance(
+                    PAUSE_BETWEEN_MODULES, list) else PAUSE_BETWEEN_MODULES
 
-            logger.info(f'Sleeping {random_sleep} seconds before {token} => ANKR swap...')
-            await sleep(random_sleep)
+                logger.info(f'Sleeping {random_sleep} seconds before {token} => ANKR swap...')
+                await pause(random_sleep)
 
-            tx_hash = await neura_client.swap(
-                from_token=token,
-                to_token='ANKR',
-                swap_percentage=1
-            )
+                tx_hash = await neura_client.swap(
+                    from_token=token,
+                    to_token='ANKR',
+                    swap_percentage=1
+                )
 
-        random_sleep = random.randint(PAUSE_BETWEEN_MODULES[0], PAUSE_BETWEEN_MODULES[1]) if isinstance(
-            PAUSE_BETWEEN_MODULES, list) else PAUSE_BETWEEN_MODULES
+            random_sleep = random.randint(PAUSE_BETWEEN_MODULES[0], PAUSE_BETWEEN_MODULES[1]) if isinstance(
+                PAUSE_BETWEEN_MODULES, list) else PAUSE_BETWEEN_MODULES
 
-        logger.info(f'Sleeping {random_sleep} seconds before next iteration...')
-        await sleep(random_sleep)
+            logger.info(f'Sleeping {random_sleep} seconds before next iteration...')
+            await pause(random_sleep)
 
-    return True
+        return True
+    finally:
+        await neura_client.close()
@@ -0,0 +1,252 @@
+import asyncio
+import heapq
+import random
+from contextlib import suppress
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from itertools import count
+from time import monotonic
+from typing import Awaitable, Callable, Optional
+
+from loguru import logger
+
+from config import (
+    PAUSE_BETWEEN_WALLETS,
+    PAUSE_BETWEEN_MODULES,
+    WALLET_STARTS_BURST,
+    SCHEDULER_STATS_INTERVAL,
+)
+from src.models.route import Route
+from src.utils.progress import progress_tracker
+
+
+class WorkerSlot:
+    def __init__(self, semaphore: asyncio.Semaphore) -> None:
+        self.semaphore = semaphore
+        self.held = False
+
+    async def acquire(self) -> None:
+        await self.semaphore.acquire()
+        self.held = True
+
+    def release(self) -> None:
+        if self.held:
+            self.held = False
+            self.semaphore.release()
+
+
+_current_slot: ContextVar[Optional[WorkerSlot]] = ContextVar('current_slot', default=None)
+
+
+async def pause(seconds: float) -> None:
+    slot = _current_slot.get()
+    if slot is None:
+        await asyncio.sleep(seconds)
+        return
+
+    slot.release()
+    await asyncio.sleep(seconds)
+    await slot.acquire()
+
+
+@dataclass
+class RouteRun:
+    route: Route
+    next_task: int = 0
+    completed_tasks: list[str] = field(default_factory=list)
+
+
+class StartPacer:
+    def __init__(self, burst: int, pause: list[int] | int, stop_event: asyncio.Event) -> None:
+        self.burst = max(1, burst)
+        self.pause = pause
+        self.stop_event = stop_event
+
+        self._tokens = self.burst
+        self._last_refill = monotonic()
+        self._interval = self._get_interval()
+        self._lock = asyncio.Lock()
+
+    def _get_interval(self) -> float:
+        return random.randint(self.pause[0], self.pause[1]) if isinstance(self.pause, list) else self.pause
+
+    def _refill(self) -> None:
+        now = monotonic()
+        while self._tokens < self.burst and now - self._last_refill >= self._interval:
+            self._last_refill += self._interval
+            self._tokens += 1
+            self._interval = self._get_interval()
+
+        if self._tokens >= self.burst:
+            self._last_refill = now
+
+    async def acquire(self, slot: WorkerSlot) -> None:
+        async with self._lock:
+            while True:
+                if self.stop_event.is_set():
+                    return
+
+                self._refill()
+                if self._tokens >= 1:
+                    break
+
+                time_to_pause = self._last_refill + self._interval - monotonic()
+                logger.info(f'Сплю {time_to_pause:.0f} секунд перед следующим кошельком...')
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self.stop_event.wait(), time_to_pause)
+
+            # the start is only counted once a slot is free, so a token is never spent on a wallet that keeps waiting
+            await slot.acquire()
+            self._refill()
+            self._tokens -= 1
+
+
+class RouteScheduler:
+    def __init__(
+            self,
+            run_module: Callable[[Route, str], Awaitable[bool]],
+            finish_route: Callable[[Route, list[str]], None],
+            slots: int,
+            interleave: bool = False,
+            workers: Optional[int] = None,
+    ) -> None:
+        self.run_module = run_module
+        self.finish_route = finish_route
+        self.slots = slots
+        self.interleave = interleave
+        self.workers = workers if interleave and workers else slots
+        self.active_workers = 0
+
+        self._queue: asyncio.Queue[Route] = asyncio.Queue()
+        self._delayed: list[tuple[float, int, RouteRun]] = []
+        self._sequence = count()
+        self._changed = asyncio.Condition()
+        self._slots = asyncio.Semaphore(slots)
+        self._stop_event = asyncio.Event()
+        self._pacer = StartPacer(burst=WALLET_STARTS_BURST, pause=PAUSE_BETWEEN_WALLETS, stop_event=self._stop_event)
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    @property
+    def delayed_count(self) -> int:
+        return len(self._delayed)
+
+    @property
+    def stopping(self) -> bool:
+        return self._stop_event.is_set()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        asyncio.get_running_loop().create_task(self._notify())
+
+    async def run(self, routes: list[Route]) -> None:
+        for route in routes:
+            self._queue.put_nowait(route)
+
+        stats_task = asyncio.create_task(self._report_stats())
+        try:
+            await asyncio.gather(*[
+                self._worker() for _ in range(min(self.workers, len(routes)))
+            ])
+        finally:
+            stats_task.cancel()
+
+    async def _worker(self) -> None:
+        slot = WorkerSlot(self._slots)
+        if self.interleave:
+            _current_slot.set(slot)
+
+        while True:
+            run = await self._next_run()
+            if run is None:
+                return
+
+            self.active_workers += 1
+            try:
+                if run.next_task == 0:
+                    await self._pacer.acquire(slot)
+                else:
+                    await slot.acquire()
+                await self._run_route(run)
+            except Exception as ex:
+                logger.error(f'[{run.route.wallet.address}] | Route failed: {ex}')
+                run.route.wallet.lock()
+            finally:
+                slot.release()
+                self.active_workers -= 1
+                await self._notify()
+
+    async def _next_run(self) -> Optional[RouteRun]:
+        while True:
+            async with self._changed:
+                while True:
+                    if self.stopping:
+                        return None
+                    if self._delayed and self._delayed[0][0] <= monotonic():
+                        return heapq.heappop(self._delayed)[2]
+                    # wallets waiting between modules are still in progress, a new one is started only below the limit
+                    if not self._queue.empty() and self.active_workers + len(self._delayed) < self.workers:
+                        break
+                    if not self._delayed and not self.active_workers:
+                        return None
+
+                    timeout = self._delayed[0][0] - monotonic() if self._delayed else None
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        pass
+
+            try:
+                return RouteRun(route=self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                continue
+
+    async def _run_route(self, run: RouteRun) -> None:
+        tasks = run.route.tasks
+
+        while run.next_task < len(tasks):
+            if self.stopping:
+                logger.info(f'[{run.route.wallet.address}] | Shutting down, remaining modules will run on next start')
+                run.route.wallet.lock()
+                return
+
+            task = tasks[run.next_task]
+            if await self.run_module(run.route, task):
+                run.completed_tasks.append(task)
+            run.next_task += 1
+
+            time_to_pause = random.randint(PAUSE_BETWEEN_MODULES[0], PAUSE_BETWEEN_MODULES[1]) \
+                if isinstance(PAUSE_BETWEEN_MODULES, list) else PAUSE_BETWEEN_MODULES
+
+            if self.interleave:
+                if run.next_task == len(tasks):
+                    break
+
+                logger.info(f'[{run.route.wallet.address}] | Next module in {time_to_pause} seconds, '
+                            f'releasing worker...')
+                run.route.wallet.lock()
+                heapq.heappush(self._delayed, (monotonic() + time_to_pause, next(self._sequence), run))
+                return
+
+            logger.info(f'Sleeping {time_to_pause} seconds before next module...')
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(self._stop_event.wait(), time_to_pause)
+
+        run.route.wallet.lock()
+        self.finish_route(run.route, run.completed_tasks)
+
+    async def _notify(self) -> None:
+        async with self._changed:
+            self._changed.notify_all()
+
+    async def _report_stats(self) -> None:
+        while True:
+            await asyncio.sleep(SCHEDULER_STATS_INTERVAL)
+            logger.info(
+                f'📊 | Wallets in queue: {self.queue_depth} | '
+                f'Waiting between modules: {self.delayed_count} | '
+                f'Active workers: {self.active_workers}/{self.workers} | '
+                f'Processed: {progress_tracker.processed_wallets}/{progress_tracker.total_wallets}'
+            )
@@ -0,0 +1,95 @@
+import asyncio
+import multiprocessing
+import queue
+import signal
+from functools import partial
+from multiprocessing.process import BaseProcess
+from time import monotonic
+from typing import Callable
+
+from loguru import logger
+
+from config import SCHEDULER_STATS_INTERVAL
+from src.utils.progress import progress_tracker
+from src.utils.signals import install_signal_handlers
+from src.utils.tg_app.telegram_notifications import WalletReport
+
+
+def get_shard(address: str, shards: int) -> int:
+    return int(address[2:], 16) % shards
+
+
+class ShardRunner:
+    def __init__(
+            self,
+            target: Callable,
+            shards: int,
+            decryption_password: str,
+            on_report: Callable[[WalletReport], None],
+    ) -> None:
+        self.target = target
+        self.shards = shards
+        self.decryption_password = decryption_password
+        self.on_report = on_report
+
+        # spawn everywhere: forking a process with a running event loop and open sockets is unsafe
+        self._context = multiprocessing.get_context('spawn')
+        self._events = self._context.Queue()
+        self._processes: list[BaseProcess] = []
+
+    @property
+    def alive_shards(self) -> int:
+        return sum(process.is_alive() for process in self._processes)
+
+    async def run(self) -> None:
+        for shard in range(self.shards):
+            process = self._context.Process(
+                target=self.target,
+                args=(shard, self.shards, self.decryption_password, self._events),
+                name=f'shard-{shard}'
+            )
+            process.start()
+            self._processes.append(process)
+
+        logger.info(f'Started {self.shards} shards')
+
+        remove_handlers = install_signal_handlers(self._on_signal)
+        try:
+            await self._collect()
+        finally:
+            remove_handlers()
+            for process in self._processes:
+                process.join()
+
+        failed = [process.name for process in self._processes if process.exitcode]
+        if failed:
+            logger.error(f'Shards exited with errors: {", ".join(failed)}')
+
+    def _on_signal(self, sig: signal.Signals) -> None:
+        # Ctrl+C reaches every process in the console group by itself, SIGTERM has to be forwarded
+        if sig == signal.SIGTERM:
+            for process in self._processes:
+                if process.is_alive():
+                    process.terminate()
+        logger.warning('Shutdown requested, waiting for shards to finish active modules...')
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        next_stats = monotonic() + SCHEDULER_STATS_INTERVAL
+
+        while True:
+            try:
+                report = await loop.run_in_executor(None, partial(self._events.get, timeout=1))
+            except queue.Empty:
+                if not self.alive_shards:
+                    return
+            else:
+                self.on_report(report)
+
+            if monotonic() >= next_stats:
+                next_stats = monotonic() + SCHEDULER_STATS_INTERVAL
+                logger.info(
+                    f'📊 | Shards alive: {self.alive_shards}/{self.shards} | '
+                    f'Completed: {progress_tracker.completed_wallets}/{progress_tracker.total_wallets} | '
+                    f'Processed: {progress_tracker.processed_wallets}/{progress_tracker.total_wallets}'
+                )
@@ -0,0 +1,31 @@
+import asyncio
+import signal
+from typing import Callable
+
+SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+
+def install_signal_handlers(callback: Callable[[signal.Signals], None]) -> Callable[[], None]:
+    loop = asyncio.get_running_loop()
+
+    try:
+        for sig in SHUTDOWN_SIGNALS:
+            loop.add_signal_handler(sig, callback, sig)
+    except NotImplementedError:
+        # Windows event loops have no add_signal_handler
+        previous = {
+            sig: signal.signal(sig, lambda signum, _: loop.call_soon_threadsafe(callback, signal.Signals(signum)))
+            for sig in SHUTDOWN_SIGNALS
+        }
+
+        def remove_handlers() -> None:
+            for sig, handler in previous.items():
+                signal.signal(sig, handler)
+
+        return remove_handlers
+
+    def remove_handlers() -> None:
+        for sig in SHUTDOWN_SIGNALS:
+            loop.remove_signal_handler(sig)
+
+    return remove_handlers
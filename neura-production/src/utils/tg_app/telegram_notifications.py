@@ -1,85 +1,138 @@
+import asyncio
+import json
 from contextlib import suppress
+from dataclasses import dataclass
+from typing import Optional
 
-from src.database.base_models.pydantic_manager import DataBaseManagerConfig
-from src.database.utils.db_manager import DataBaseUtils
+from loguru import logger
+
+from config import TG_BOT_TOKEN, TG_USER_ID, TG_DIGEST_WALLETS, TG_DIGEST_INTERVAL
+from src.utils.batch_queue import BatchQueue
+from src.utils.progress import progress_tracker
 from src.utils.request_client.curl_cffi_client import CurlCffiClient
-from src.utils.user.account import Account
+
+MAX_MESSAGE_LENGTH = 4096
+
+
+@dataclass
+class WalletReport:
+    address: str
+    completed_tasks: list[str]
+    uncompleted_tasks: list[str]
 
 
-class TGApp(CurlCffiClient):
+class TGNotifier(CurlCffiClient):
+    # noinspection PyMissingConstructor
     def __init__(
             self,
             token: str,
-            tg_id: int,
-            private_key: str,
-            encrypted_key: bytes,
-            processed_index: int,
+            tg_id: Optional[int],
+            digest_wallets: int,
+            digest_interval: float,
     ):
-        self.processed_index = processed_index
-        self.private_key = private_key
-        self.encrypted_key = encrypted_key
-        self.__account = Account(
-            private_key=private_key,
-            proxy=None
-        )
-
         self.token = token
         self.tg_id = tg_id
-        super().__init__(proxy=None)
+        self.digest_wallets = digest_wallets
+        self.digest_interval = digest_interval
 
-        self.__db_utils = DataBaseUtils(
-            manager_config=DataBaseManagerConfig(
-                action='wallets_tasks'
-            )
-        )
+        self.session = None
+        self._digests = BatchQueue(self._send_digest, batch_size=digest_wallets, flush_interval=digest_interval)
 
-    async def _get_text(self) -> str:
-        completed_tasks, uncompleted_tasks = await self.__db_utils.get_tasks_info(self.encrypted_key)
-
-        completed_tasks_list = "\n".join(f"- {task.task_name}" for task in completed_tasks) or "No tasks completed."
-        uncompleted_tasks_list = "\n".join(
-            f"- {task.task_name}" for task in uncompleted_tasks) or "All tasks completed."
-
-        completed_wallets_count = await self.__db_utils.get_completed_wallets_count()
-        total_wallets_count = await self.__db_utils.get_total_wallets_count()
-        completed_tasks_list = escape_markdown_v2(completed_tasks_list)
-        uncompleted_tasks_list = escape_markdown_v2(uncompleted_tasks_list)
-
-        text = (
-            f"💼 **Wallet completed its work:**\n"
-            f"`{self.__account.wallet_address}`\n\n"
-            f"📋 **Task Summary:**\n"
-            f"✅ **Completed Tasks:** {len(completed_tasks)}\n"
-            f"❌ **Uncompleted Tasks:** {len(uncompleted_tasks)}\n\n"
-            f"🔍 **Details:**\n\n"
-            f"**Completed Tasks:**\n{completed_tasks_list}\n\n"
-            f"**Uncompleted Tasks:**\n{uncompleted_tasks_list}\n\n"
-            f"📊 **Overall Progress:**\n"
-            f"**Completed Wallets:** {completed_wallets_count}/{total_wallets_count}\n"
-            f"**Processed Wallets:** {self.processed_index}/{total_wallets_count}"
-        )
+    @property
+    def enabled(self) -> bool:
+        return bool(self.token and self.tg_id)
 
-        return text
+    def wallet_finished(self, report: WalletReport) -> None:
+        if not self.enabled:
+            return
 
-    async def send_message(self) -> None:
-        text = await self._get_text()
+        if not self._digests.running:
+            CurlCffiClient.__init__(self, proxy=None)
+
+        self._digests.put_nowait(report)
+
+    async def close(self) -> None:
+        if not self._digests.running:
+            return
+
+        await self._digests.close()
 
-        await self.make_request(
-            method='GET',
-            url=f'https://api.telegram.org/bot{self.token}/sendMessage',
-            params={
-                "parse_mode": "MarkdownV2",
-                "disable_web_page_preview": 1,
-                "chat_id": self.tg_id,
-                "text": text,
-            }
-        )
         with suppress(Exception):
             await self.session.close()
 
+    async def _send_digest(self, reports: list[WalletReport]) -> None:
+        for text in self._get_messages(reports):
+            await self._send_message(text)
+
+    @staticmethod
+    def _get_header(wallets: int) -> str:
+        return escape_markdown_v2(f"💼 {wallets} wallets completed their work:") + "\n\n"
+
+    def _get_messages(self, reports: list[WalletReport]) -> list[str]:
+        footer = (
+            f"📊 **Overall Progress:**\n"
+            f"**Completed Wallets:** {progress_tracker.completed_wallets}/{progress_tracker.total_wallets}\n"
+            f"**Processed Wallets:** {progress_tracker.processed_wallets}/{progress_tracker.total_wallets}"
+        )
+        # every message counts only its own wallets, the header for all reports is the longest one possible
+        reserved = len(self._get_header(len(reports))) + len(footer)
+
+        messages, blocks = [], []
+        length = reserved
+        for report in reports:
+            block = (
+                f"`{report.address}`\n"
+                f"✅ {escape_markdown_v2(', '.join(report.completed_tasks) or 'No tasks completed.')}\n"
+                f"❌ {escape_markdown_v2(', '.join(report.uncompleted_tasks) or 'All tasks completed.')}\n\n"
+            )
+            if blocks and length + len(block) > MAX_MESSAGE_LENGTH:
+                messages.append(self._get_header(len(blocks)) + ''.join(blocks) + footer)
+                blocks, length = [], reserved
+
+            blocks.append(block)
+            length += len(block)
+
+        messages.append(self._get_header(len(blocks)) + ''.join(blocks) + footer)
+        return messages
+
+    async def _send_message(self, text: str) -> None:
+        for _ in range(3):
+            try:
+                response, status = await self.make_request(
+                    method='GET',
+                    url=f'https://api.telegram.org/bot{self.token}/sendMessage',
+                    params={
+                        "parse_mode": "MarkdownV2",
+                        "disable_web_page_preview": 1,
+                        "chat_id": self.tg_id,
+                        "text": text,
+                    }
+                )
+            except Exception as ex:
+                logger.error(f'Failed to send Telegram notification | {ex}')
+                return
+
+            if status != 429:
+                if status != 200:
+                    logger.error(f'Failed to send Telegram notification | Status: {status} | {response}')
+                return
+
+            retry_after = 5
+            with suppress(Exception):
+                retry_after = json.loads(response)['parameters']['retry_after']
+            await asyncio.sleep(retry_after)
+
 
 def escape_markdown_v2(text: str) -> str:
     specials = r"_-*[]()~`>#+=|{}.!"
     for char in specials:
         text = text.replace(char, f"\\{char}")
     return text
+
+
+tg_notifier = TGNotifier(
+    token=TG_BOT_TOKEN,
+    tg_id=TG_USER_ID,
+    digest_wallets=TG_DIGEST_WALLETS,
+    digest_interval=TG_DIGEST_INTERVAL
+)
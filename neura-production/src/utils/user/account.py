@@ -1,49 +1,39 @@
-from time import time
-from asyncio import sleep
-
 from eth_account.messages import encode_defunct
-from web3.exceptions import TransactionNotFound
 from web3.types import TxParams
-from web3.eth import AsyncEth
 from eth_typing import HexStr
-from web3 import AsyncWeb3
 from loguru import logger
 
 from src.models.contracts import ERC20
-from src.utils.data.chains import NEURA
+from src.utils.data.chains import Chain, NEURA
 from src.utils.user.utils import Utils
 from src.utils.proxy_manager import Proxy
+from src.utils.request_client.web3_pool import web3_pool
+from src.utils.user.block_watcher import get_block_watcher
+from src.utils.user.nonce_manager import nonce_manager
 
 
 class Account(Utils):
     def __init__(
             self,
             private_key: str,
-            rpc=NEURA.rpc,
+            chain: Chain = NEURA,
             *,
             proxy: Proxy | None
     ) -> None:
         self.private_key = private_key
+        self.chain = chain
 
-        request_args = {} if proxy is None else {
-            'proxy': proxy.proxy_url
-        }
-
-        self.web3 = AsyncWeb3(
-            provider=AsyncWeb3.AsyncHTTPProvider(
-                endpoint_uri=rpc,
-                request_kwargs={**request_args, 'verify_ssl': False} if request_args else {'verify_ssl': False}
-            ),
-            modules={'eth': (AsyncEth,)},
-        )
+        self.web3 = web3_pool.get(chain.rpc, proxy.proxy_url if proxy else None)
         self.account = self.web3.eth.account.from_key(private_key)
         self.wallet_address = self.account.address
 
+    async def get_chain_id(self) -> int:
+        await web3_pool.verify_chain(self.web3, self.chain)
+        return self.chain.chain_id
+
     async def get_wallet_balance(self, is_native: bool, address: str = None) -> int:
         if not is_native:
-            contract = self.web3.eth.contract(
-                address=self.web3.to_checksum_address(address), abi=ERC20.abi
-            )
+            contract = self.load_contract(address, self.web3, ERC20.abi)
             balance = await contract.functions.balanceOf(self.wallet_address).call()
         else:
             balance = await self.web3.eth.get_balance(self.wallet_address)
@@ -57,24 +47,19 @@ class Account(Utils):
         return tx_hash
 
     async def wait_until_tx_finished(self, tx_hash: HexStr, max_wait_time=600) -> bool:
-        start_time = time()
-        while True:
-            try:
-                receipts = await self.web3.eth.get_transaction_receipt(tx_hash)
-                status = receipts.get("status")
-                if status == 1:
-                    logger.success(f"Transaction confirmed!")
-                    return True
-                elif status is None:
-                    await sleep(0.3)
-                else:
-                    logger.error(f"Transaction failed!")
-                    return False
-            except TransactionNotFound:
-                if time() - start_time > max_wait_time:
-                    print(f'FAILED TX: {tx_hash}')
-                    return False
-                await sleep(1)
+        receipt = await get_block_watcher(self.chain.chain_id).wait_for_receipt(self.web3, tx_hash, max_wait_time)
+        if receipt is None:
+            print(f'FAILED TX: {tx_hash}')
+            # the tx may have been dropped, the next one must not queue behind its nonce
+            nonce_manager.reset(self.chain.chain_id, self.wallet_address)
+            return False
+
+        if receipt.get("status") == 1:
+            logger.success(f"Transaction confirmed!")
+            return True
+
+        logger.error(f"Transaction failed!")
+        return False
 
     def get_signature(self, message: str) -> str:
         signed_message = self.web3.eth.account.sign_message(
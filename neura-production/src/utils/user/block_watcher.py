@@ -0,0 +1,143 @@
+import asyncio
+from typing import Optional
+
+from loguru import logger
+from web3 import AsyncWeb3
+from web3.exceptions import TransactionNotFound
+from web3.types import TxReceipt
+
+from config import BLOCK_POLL_INTERVAL
+
+# every N blocks pending hashes are also checked directly, in case the block with the tx was missed
+RECHECK_BLOCKS = 20
+# if the watcher fell further behind than this, it jumps to the head and rechecks pending hashes directly
+MAX_BLOCKS_BEHIND = 50
+# failed polls in a row after which the errors are reported as warnings instead of debug messages
+MAX_POLL_ERRORS = 3
+
+
+class BlockWatcher:
+    def __init__(self, poll_interval: float) -> None:
+        self.poll_interval = poll_interval
+        # only used for polling blocks, receipts are always requested through the waiting wallet's own client
+        self.web3: Optional[AsyncWeb3] = None
+
+        self._pending: dict[str, tuple[asyncio.Future, AsyncWeb3]] = {}
+        self._last_block: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._errors = 0
+
+    async def wait_for_receipt(self, web3: AsyncWeb3, tx_hash: str, timeout: float) -> Optional[TxReceipt]:
+        if self.web3 is None:
+            self.web3 = web3
+
+        tx_hash = tx_hash.lower()
+        pending = self._pending.get(tx_hash)
+        if pending is None:
+            pending = (asyncio.get_running_loop().create_future(), web3)
+            self._pending[tx_hash] = pending
+        future = pending[0]
+
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        # the tx could have been mined before it was registered
+        try:
+            receipt = await self._get_receipt(tx_hash)
+        except Exception as ex:
+            logger.debug(f'Block watcher | {ex}')
+        else:
+            if receipt is not None:
+                self._resolve(tx_hash, receipt)
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            if self._pending.get(tx_hash) is pending:
+                del self._pending[tx_hash]
+
+    async def _run(self) -> None:
+        scanned = 0
+        while self._pending:
+            try:
+                block_number = await self.web3.eth.block_number
+                if self._last_block is None or block_number - self._last_block > MAX_BLOCKS_BEHIND:
+                    if self._last_block is not None:
+                        await self._recheck_pending()
+                    self._last_block = block_number - 1
+
+                for number in range(self._last_block + 1, block_number + 1):
+                    await self._scan_block(number)
+                    self._last_block = number
+                    scanned += 1
+                    if scanned % RECHECK_BLOCKS == 0:
+                        await self._recheck_pending()
+            except Exception as ex:
+                self._errors += 1
+                if self._errors < MAX_POLL_ERRORS:
+                    logger.debug(f'Block watcher | {ex}')
+                else:
+                    logger.warning(f'Block watcher | Polling failed {self._errors} times in a row | {ex}')
+                # the client may be stuck behind a dead proxy, the next poll goes through another waiting wallet
+                self._switch_web3()
+            else:
+                self._errors = 0
+
+            await asyncio.sleep(self.poll_interval)
+
+        self._last_block = None
+        self.web3 = None
+
+    async def _scan_block(self, number: int) -> None:
+        block = await self.web3.eth.get_block(number)
+        hashes = [self.web3.to_hex(tx_hash).lower() for tx_hash in block['transactions']]
+        mined = [tx_hash for tx_hash in hashes if tx_hash in self._pending]
+        if not mined:
+            return
+
+        await self._check_receipts(mined)
+
+    async def _recheck_pending(self) -> None:
+        await self._check_receipts(list(self._pending))
+
+    async def _check_receipts(self, hashes: list[str]) -> None:
+        # a failed lookup only affects its own wallet, the hash is checked again on the next recheck
+        receipts = await asyncio.gather(*[self._get_receipt(tx_hash) for tx_hash in hashes], return_exceptions=True)
+        for tx_hash, receipt in zip(hashes, receipts):
+            if isinstance(receipt, BaseException):
+                logger.debug(f'Block watcher | {receipt}')
+            elif receipt is not None:
+                self._resolve(tx_hash, receipt)
+
+    async def _get_receipt(self, tx_hash: str) -> Optional[TxReceipt]:
+        pending = self._pending.get(tx_hash)
+        if pending is None:
+            return None
+
+        try:
+            return await pending[1].eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            return None
+
+    def _switch_web3(self) -> None:
+        clients = [web3 for _, web3 in self._pending.values() if web3 is not self.web3]
+        if clients:
+            self.web3 = clients[-1]
+
+    def _resolve(self, tx_hash: str, receipt: TxReceipt) -> None:
+        pending = self._pending.get(tx_hash)
+        if pending is not None and not pending[0].done():
+            pending[0].set_result(receipt)
+
+
+_watchers: dict[int, BlockWatcher] = {}
+
+
+def get_block_watcher(chain_id: int) -> BlockWatcher:
+    watcher = _watchers.get(chain_id)
+    if watcher is None:
+        watcher = BlockWatcher(poll_interval=BLOCK_POLL_INTERVAL)
+        _watchers[chain_id] = watcher
+    return watcher
@@ -0,0 +1,74 @@
+import asyncio
+from dataclasses import dataclass
+from time import monotonic
+from typing import Optional
+
+from web3 import AsyncWeb3
+
+from config import GAS_PRICE_TTL, USE_EIP1559
+
+
+@dataclass
+class GasFees:
+    gas_price: int
+    max_fee_per_gas: Optional[int] = None
+    max_priority_fee_per_gas: Optional[int] = None
+
+    def as_tx_params(self, multiplier: float = 1) -> dict[str, int]:
+        if self.max_fee_per_gas is None:
+            return {'gasPrice': int(self.gas_price * multiplier)}
+
+        return {
+            'maxFeePerGas': int(self.max_fee_per_gas * multiplier),
+            'maxPriorityFeePerGas': int(self.max_priority_fee_per_gas * multiplier),
+        }
+
+
+class GasOracle:
+    def __init__(self, ttl: float, eip1559: bool) -> None:
+        self.ttl = ttl
+        self.eip1559 = eip1559
+
+        self._fees: dict[int, tuple[float, GasFees]] = {}
+        self._requests: dict[int, asyncio.Task] = {}
+
+    async def get_fees(self, web3: AsyncWeb3, chain_id: int) -> GasFees:
+        cached = self._fees.get(chain_id)
+        if cached and monotonic() - cached[0] < self.ttl:
+            return cached[1]
+
+        request = self._requests.get(chain_id)
+        if request is None:
+            request = asyncio.create_task(self._fetch(web3, chain_id))
+            request.add_done_callback(lambda _: self._requests.pop(chain_id, None))
+            self._requests[chain_id] = request
+
+        # one caller being cancelled must not cancel the request for everyone else
+        return await asyncio.shield(request)
+
+    def invalidate(self, chain_id: int) -> None:
+        self._fees.pop(chain_id, None)
+
+    async def _fetch(self, web3: AsyncWeb3, chain_id: int) -> GasFees:
+        block, gas_price, priority_fee = await asyncio.gather(
+            web3.eth.get_block('latest'),
+            web3.eth.gas_price,
+            web3.eth.max_priority_fee,
+            return_exceptions=True
+        )
+        if isinstance(gas_price, BaseException):
+            raise gas_price
+
+        fees = GasFees(gas_price=gas_price)
+        base_fee = None if isinstance(block, BaseException) else block.get('baseFeePerGas')
+        if self.eip1559 and base_fee is not None:
+            if isinstance(priority_fee, BaseException):
+                priority_fee = max(gas_price - base_fee, 0)
+            fees.max_priority_fee_per_gas = priority_fee
+            fees.max_fee_per_gas = base_fee * 2 + priority_fee
+
+        self._fees[chain_id] = (monotonic(), fees)
+        return fees
+
+
+gas_oracle = GasOracle(ttl=GAS_PRICE_TTL, eip1559=USE_EIP1559)
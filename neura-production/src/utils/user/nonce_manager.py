@@ -0,0 +1,47 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+from loguru import logger
+from web3 import AsyncWeb3
+
+NONCE_ERRORS = ('nonce too low', 'nonce too high', 'already known', 'replacement transaction underpriced')
+
+
+class NonceManager:
+    def __init__(self) -> None:
+        self._nonces: dict[tuple[int, str], int] = {}
+        self._locks: dict[tuple[int, str], asyncio.Lock] = {}
+
+    @asynccontextmanager
+    async def reserve(self, web3: AsyncWeb3, chain_id: int, address: str) -> AsyncIterator[int]:
+        key = (chain_id, address)
+        async with self._locks.setdefault(key, asyncio.Lock()):
+            nonce = self._nonces.get(key)
+            if nonce is None:
+                nonce = await web3.eth.get_transaction_count(address, 'pending')
+            self._nonces[key] = nonce + 1
+
+        try:
+            yield nonce
+        except Exception as ex:
+            if any(error in str(ex).lower() for error in NONCE_ERRORS):
+                logger.warning(f'[{address}] | Nonce {nonce} rejected, resyncing with RPC | {ex}')
+                self.reset(chain_id, address)
+            else:
+                self.release(chain_id, address, nonce)
+            raise
+
+    def release(self, chain_id: int, address: str, nonce: int) -> None:
+        key = (chain_id, address)
+        if self._nonces.get(key) == nonce + 1:
+            self._nonces[key] = nonce
+        else:
+            # a later nonce was already handed out, the gap can only be fixed by asking the RPC again
+            self._nonces.pop(key, None)
+
+    def reset(self, chain_id: int, address: str) -> None:
+        self._nonces.pop((chain_id, address), None)
+
+
+nonce_manager = NonceManager()
@@ -1,31 +1,54 @@
 from typing import (
+    Any,
     Awaitable,
     Callable,
     Optional,
     Union,
 )
 
-from asyncio import sleep
+from asyncio import sleep, gather
 
-from web3.contract import AsyncContract
 from web3 import AsyncWeb3
 from loguru import logger
-from src.models.contracts import ERC20
+from config import BATCH_RPC_READS, RETRIES
+from src.models.contracts import ERC20, BoundContract, get_contract
+from src.utils.user.block_watcher import get_block_watcher
+from src.utils.user.gas_oracle import gas_oracle
+from src.utils.user.nonce_manager import nonce_manager
 
 from eth_typing import (
     Address,
-    HexStr,
 )
 
+BASE_FEE_ERROR = 'max fee per gas less than block base fee'
+
 
 class Utils:
     @staticmethod
-    def load_contract(address: str, web3: AsyncWeb3, abi: str) -> Optional[AsyncContract]:
+    def load_contract(address: str, web3: AsyncWeb3, abi: str) -> Optional[BoundContract]:
         if address is None:
             return None
 
-        address = web3.to_checksum_address(address)
-        return web3.eth.contract(address=address, abi=abi)
+        return get_contract(web3, address, abi)
+
+    @staticmethod
+    async def batch_read(web3: AsyncWeb3, *requests: Callable[[], Any]) -> list[Any]:
+        # every request is a factory like `lambda: web3.eth.gas_price` or `lambda: contract.functions.balanceOf(address)`,
+        # it is called again for the fallback because a coroutine created for the batch can not be awaited twice
+        if BATCH_RPC_READS:
+            try:
+                async with web3.batch_requests() as batch:
+                    for request in requests:
+                        batch.add(request())
+                    return await batch.async_execute()
+            except Exception as ex:
+                logger.debug(f'Batch request failed, sending requests one by one | {ex}')
+
+        async def send(request: Callable[[], Any]) -> Any:
+            payload = request()
+            return await (payload.call() if hasattr(payload, 'call') else payload)
+
+        return list(await gather(*[send(request) for request in requests]))
 
     async def get_decimals(self, contract_address: str, web3: AsyncWeb3) -> int:
         contract = self.load_contract(contract_address, web3, ERC20.abi)
@@ -39,46 +62,61 @@ class Utils:
             from_token_address: str,
             spender: str,
             address_wallet: Address,
-            web3: AsyncWeb3
-    ) -> Optional[HexStr]:
-        while True:
+            web3: AsyncWeb3,
+            allowance_amount: Optional[int] = None
+    ) -> bool:
+        for attempt in range(RETRIES + 1):
             try:
                 spender = web3.to_checksum_address(spender)
                 contract = self.load_contract(from_token_address, web3, ERC20.abi)
-                allowance_amount = await self.check_allowance(web3, from_token_address, address_wallet, spender)
-                if amount > allowance_amount:
-                    logger.debug('🛠️ | Approving token...')
+                if allowance_amount is None:
+                    allowance_amount = await self.check_allowance(web3, from_token_address, address_wallet, spender)
+                if amount <= allowance_amount:
+                    return True
+
+                logger.debug('🛠️ | Approving token...')
+                chain_id, fees = await gather(
+                    self.get_chain_id(),
+                    gas_oracle.get_fees(web3, self.chain.chain_id)
+                )
+                async with nonce_manager.reserve(web3, chain_id, address_wallet) as nonce:
                     tx = await contract.functions.approve(
                         spender,
                         int(2 ** 256 - 1)
                     ).build_transaction({
-                        'chainId': await web3.eth.chain_id,
+                        'chainId': chain_id,
                         'from': address_wallet,
-                        'nonce': await web3.eth.get_transaction_count(address_wallet),
-                        'gasPrice': await web3.eth.gas_price
+                        'nonce': nonce,
+                        **fees.as_tx_params()
                     })
 
                     signed_tx = web3.eth.account.sign_transaction(tx, private_key=private_key)
                     raw_tx_hash = await web3.eth.send_raw_transaction(signed_tx.raw_transaction)
-                    await sleep(10)
-                    tx_receipt = await web3.eth.wait_for_transaction_receipt(raw_tx_hash)
-                    while tx_receipt is None:
-                        await sleep(1)
-                        tx_receipt = await web3.eth.get_transaction_receipt(raw_tx_hash)
-                    tx_hash = web3.to_hex(raw_tx_hash)
-                    logger.success(f'✔️ | Token approved')
-                    await sleep(5)
-                    return tx_hash
-                else:
-                    break
-            except ValueError as ex:
-                if 'max fee per gas less than block base fee' in str(ex):
+                tx_hash = web3.to_hex(raw_tx_hash)
+                tx_receipt = await get_block_watcher(chain_id).wait_for_receipt(web3, tx_hash, timeout=600)
+                if tx_receipt is None:
+                    logger.error(f'Approve transaction was not confirmed in time | TX: {tx_hash}')
+                    nonce_manager.reset(chain_id, address_wallet)
+                    return False
+                if tx_receipt.get('status') != 1:
+                    logger.error(f'Approve transaction failed | TX: {tx_hash}')
+                    return False
+                logger.success(f'✔️ | Token approved')
+                return True
+
+            except Exception as ex:
+                # RPC errors are Web3RPCError, not ValueError, so the base fee error is matched by its message
+                if BASE_FEE_ERROR in str(ex) and attempt < RETRIES:
+                    logger.warning(f'Gas price is below the base fee, refreshing it | Attempt {attempt + 1}/{RETRIES}')
+                    gas_oracle.invalidate(self.chain.chain_id)
+                    allowance_amount = None
                     await sleep(1)
                     continue
 
-            except Exception as ex:
                 logger.error(f'Something went wrong | {ex}')
-                break
+                return False
+
+        return False
 
     @staticmethod
     async def check_allowance(
@@ -88,8 +126,7 @@ class Utils:
             spender: str
     ) -> Optional[int]:
         try:
-            contract = web3.eth.contract(address=web3.to_checksum_address(from_token_address),
-                                         abi=ERC20.abi)
+            contract = get_contract(web3, from_token_address, ERC20.abi)
             amount_approved = await contract.functions.allowance(address_wallet, spender).call()
             return amount_approved
 